@@ -1,16 +1,64 @@
 import logging
-from openai import OpenAI
+from openai import OpenAI, AsyncOpenAI
 from utils.error_handling import AppError, log_error
 import time
 import json
+import re
+import orjson
 
 logger = logging.getLogger(__name__)
 
+CHAT_MODEL = "gpt-3.5-turbo"
+
 class APIError(AppError):
     """OpenAI API related errors"""
     def __init__(self, message: str):
         super().__init__(message, "API Error")
 
+class CollegeStreamParser:
+    """Incrementally extract complete college objects from a streamed matches JSON document."""
+    _COLLEGES_START = re.compile(r'"colleges"\s*:\s*\[')
+
+    def __init__(self):
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = None  # index just past the last consumed array element
+        self.done = False
+
+    def feed(self, text):
+        """Add streamed text and return any colleges that are now complete."""
+        self._buffer += text
+        colleges = []
+        if self.done:
+            return colleges
+
+        if self._pos is None:
+            match = self._COLLEGES_START.search(self._buffer)
+            if not match:
+                return colleges
+            self._pos = match.end()
+        elif '}' not in text:
+            # An element can only have completed if a closing brace arrived
+            return colleges
+
+        while True:
+            pos = self._pos
+            while pos < len(self._buffer) and self._buffer[pos] in ' \t\r\n,':
+                pos += 1
+            if pos >= len(self._buffer):
+                break
+            if self._buffer[pos] == ']':
+                self.done = True
+                break
+            try:
+                college, end = self._decoder.raw_decode(self._buffer, pos)
+            except json.JSONDecodeError:
+                break  # element not fully received yet
+            colleges.append(college)
+            self._pos = end
+
+        return colleges
+
 class CounselorAgent:
     def __init__(self):
         self.client = OpenAI()
@@ -37,7 +85,7 @@ class CounselorAgent:
         while retry_count < self.MAX_RETRIES:
             try:
                 completion_params = {
-                    "model": "gpt-3.5-turbo",
+                    "model": CHAT_MODEL,
                     "messages": messages,
                     "temperature": temperature
                 }
@@ -89,11 +137,9 @@ class CounselorAgent:
         messages.append({"role": "user", "content": message})
         return messages
 
-    def generate_college_matches(self, profile, limit=10):
-        """Generate personalized college recommendations with detailed matching criteria."""
-        try:
-            logger.info("Generating personalized college matches")
-            prompt = f"""
+    def _build_matches_prompt(self, profile, limit):
+        """Build the college matching prompt for a student profile"""
+        return f"""
             Based on this student's profile, recommend {limit} best-fit colleges. 
             Provide a structured analysis in JSON format with the following schema:
             {{
@@ -123,22 +169,58 @@ class CounselorAgent:
             - Target Majors: {', '.join(profile.get('target_majors', []))}
             """
 
+    def generate_college_matches_dict(self, profile, limit=10):
+        """Generate personalized college recommendations and return them as a parsed dict."""
+        try:
+            logger.info("Generating personalized college matches")
+            prompt = self._build_matches_prompt(profile, limit)
+
             response = self._make_api_call(
                 [{"role": "user", "content": prompt}],
                 temperature=0.7,
                 response_format={"type": "json_object"}
             )
 
-            # Validate and serialize the response
-            recommendations = json.loads(response)
-            recommendations_json = json.dumps(recommendations)
+            # The model output is parsed once; callers serialize only if they need to
+            recommendations = orjson.loads(response)
             logger.info(f"Generated {len(recommendations.get('colleges', []))} college matches")
-            return recommendations_json  # Return JSON string instead of dict
+            return recommendations
 
         except Exception as e:
             logger.error(f"Error generating college matches: {str(e)}")
             raise APIError("Unable to generate college recommendations. Please try again later.")
 
+    async def generate_college_matches_stream(self, profile, limit=10):
+        """Stream personalized college recommendations, yielding each college as soon as it is complete."""
+        try:
+            logger.info("Streaming personalized college matches")
+            prompt = self._build_matches_prompt(profile, limit)
+            parser = CollegeStreamParser()
+            count = 0
+
+            # A fresh async client per stream keeps its connections bound to the calling event loop
+            async with AsyncOpenAI() as client:
+                stream = await client.chat.completions.create(
+                    model=CHAT_MODEL,
+                    messages=[{"role": "user", "content": prompt}],
+                    temperature=0.7,
+                    response_format={"type": "json_object"},
+                    stream=True
+                )
+                async for chunk in stream:
+                    delta = chunk.choices[0].delta.content if chunk.choices else None
+                    if not delta:
+                        continue
+                    for college in parser.feed(delta):
+                        count += 1
+                        yield college
+
+            logger.info(f"Streamed {count} college matches")
+
+        except Exception as e:
+            logger.error(f"Error streaming college matches: {str(e)}")
+            raise APIError("Unable to generate college recommendations. Please try again later.")
+
     def suggest_improvements(self, profile):
         """Suggest ways to improve college application."""
         try:
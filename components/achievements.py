@@ -8,7 +8,7 @@ logger = logging.getLogger(__name__)
 @handle_error
 def render_achievements():
     """Render the achievements panel showing user progress."""
-    if not hasattr(st.session_state, 'user'):
+    if 'user' not in st.session_state:
         return
 
     try:
@@ -1,6 +1,7 @@
 """Chat component for the College Compass application."""
 import streamlit as st
 from agents.orchestrator import AgentOrchestrator
+from models.user import User
 from utils.error_handling import handle_error, DatabaseError, ValidationError, AgentError
 import logging
 import traceback
@@ -45,7 +46,7 @@ def handle_plan_item_add(item_id: str, item: dict) -> None:
     if not st.session_state[state_key]:
         logger.info(f"Processing plan item add for item {item_id}")
         try:
-            if not hasattr(st.session_state, 'user') or not st.session_state.user:
+            if 'user' not in st.session_state or not st.session_state.user:
                 logger.error("No user in session state")
                 st.error("Please log in to add items to your plan")
                 return
@@ -144,7 +145,7 @@ def add_to_plan(actionable_item: dict) -> tuple[bool, str]:
     try:
         logger.info(f"Adding item to plan: {actionable_item}")
 
-        if not hasattr(st.session_state, 'user') or not st.session_state.user:
+        if 'user' not in st.session_state or not st.session_state.user:
             logger.error("No user in session state")
             return False, "Please log in to add items to your plan"
 
@@ -245,7 +246,7 @@ def render_chat():
                                 response = loop.run_until_complete(
                                     st.session_state.agent_orchestrator.process_message(
                                         prompt,
-                                        st.session_state.user.id if hasattr(st.session_state, 'user') else None
+                                        st.session_state.user.id if 'user' in st.session_state else None
                                     )
                                 )
                                 logger.info("Successfully got response from agent orchestrator")
@@ -262,7 +263,7 @@ def render_chat():
                                 st.session_state.messages.append({"role": "assistant", "content": response})
 
                                 # Save chat session if user is authenticated
-                                if hasattr(st.session_state, 'user') and st.session_state.user:
+                                if 'user' in st.session_state and st.session_state.user:
                                     save_chat_session(prompt, response)
                                     logger.info("Chat message saved successfully")
 
@@ -297,9 +298,15 @@ def render_chat():
         st.rerun()
 
 # Helper functions for chat management
+@st.cache_data(ttl=60, show_spinner=False)
+def get_cached_chat_sessions(user_id):
+    """Return a user's chat sessions, cached briefly to avoid a query on every rerun."""
+    return [dict(session) for session in User(id=user_id).get_chat_sessions()]
+
 @handle_error
 def new_chat_session():
     """Start a new chat session."""
+    get_cached_chat_sessions.clear()
     st.session_state.messages = []
     st.session_state.current_session_id = None
     logger.info("Started new chat session")
@@ -318,6 +325,7 @@ def save_chat_session(prompt, response):
                 (user.id, prompt[:50] + "...")
             )
             st.session_state.current_session_id = result['id']
+            get_cached_chat_sessions.clear()
             logger.info(f"Created new chat session {result['id']}")
 
         # Save messages
@@ -338,4 +346,4 @@ def save_chat_session(prompt, response):
         raise DatabaseError("Failed to save chat messages")
 
 # Make sure the functions are properly exported
-__all__ = ['render_chat', 'new_chat_session']
\ No newline at end of file
+__all__ = ['render_chat', 'new_chat_session', 'get_cached_chat_sessions']
\ No newline at end of file
@@ -10,7 +10,7 @@ logger = logging.getLogger(__name__)
 
 def get_user_favorites() -> List[int]:
     """Get list of institution IDs favorited by the current user."""
-    if not hasattr(st.session_state, 'user'):
+    if 'user' not in st.session_state:
         return []
 
     try:
@@ -25,9 +25,13 @@ def get_user_favorites() -> List[int]:
         logger.error(f"Error fetching user favorites: {str(e)}")
         return []
 
-def toggle_favorite(institution_id: int):
-    """Toggle favorite status for an institution."""
-    if not hasattr(st.session_state, 'user'):
+def toggle_favorite(institution_id: int, scope: str = "app"):
+    """Toggle favorite status for an institution.
+
+    Pass scope="fragment" when called from inside an st.fragment so only that
+    fragment reruns afterwards.
+    """
+    if 'user' not in st.session_state:
         st.warning("Please log in to save favorites.")
         return
 
@@ -53,7 +57,7 @@ def toggle_favorite(institution_id: int):
             st.success("Added to favorites!")
 
         # Force streamlit to rerun to update the UI
-        st.rerun()
+        st.rerun(scope=scope)
     except Exception as e:
         logger.error(f"Error toggling favorite: {str(e)}")
         st.error("Failed to update favorites. Please try again.")
@@ -63,17 +67,22 @@ def calculate_admission_chance(student_profile: Dict, institution_stats: Dict) -
     # This is a simplified calculation - we can make it more sophisticated later
     base_chance = 0.5
 
+    # Each value is looked up once; missing or zero values earn no bonus
+    sat_score = student_profile.get('sat_score')
+    sat_75th = institution_stats.get('sat_75th_percentile')
+    gpa = student_profile.get('gpa')
+    avg_gpa = institution_stats.get('avg_gpa')
+
     # SAT score comparison
-    if student_profile.get('sat_score') and institution_stats.get('sat_75th_percentile'):
-        if student_profile['sat_score'] >= institution_stats['sat_75th_percentile']:
+    if sat_score and sat_75th:
+        if sat_score >= sat_75th:
             base_chance += 0.3
-        elif student_profile['sat_score'] >= institution_stats['sat_75th_percentile'] * 0.9:
+        elif sat_score >= sat_75th * 0.9:
             base_chance += 0.15
 
     # GPA comparison (if available)
-    if student_profile.get('gpa') and institution_stats.get('avg_gpa'):
-        if student_profile['gpa'] >= institution_stats['avg_gpa']:
-            base_chance += 0.2
+    if gpa and avg_gpa and gpa >= avg_gpa:
+        base_chance += 0.2
 
     # Cap the chance at 95%
     return min(0.95, base_chance)
@@ -322,7 +331,7 @@ def render_college_explorer():
     """Main function to render the college explorer dashboard."""
     st.title("🏛️ College Explorer Dashboard")
 
-    if not hasattr(st.session_state, 'user'):
+    if 'user' not in st.session_state:
         st.warning("Please log in to access all features of the College Explorer.")
         return
 
@@ -403,6 +412,11 @@ def render_college_explorer():
     render_institutions_list(filters)
 
     # User's favorite institutions
+    render_favorites()
+
+@st.fragment
+def render_favorites():
+    """Render the user's favorite institutions; reruns on its own when a favorite is toggled."""
     st.markdown("### ⭐ My Favorite Institutions")
     favorites = get_user_favorites()
 
@@ -411,10 +425,10 @@ def render_college_explorer():
             db = Database()
             fav_institutions = db.execute("""
                 SELECT 
-                    i.*,
-                    true as is_favorite
+                    i.unitid, i.institution_name, i.city, i.state_abbreviation,
+                    i.control_of_institution, i.typical_housing_charge
                 FROM institutions i
-                WHERE i.unitid = ANY(%s)
+                JOIN unnest(%s::int[]) AS f(unitid) USING (unitid)
                 ORDER BY institution_name
             """, (favorites,))
 
@@ -434,8 +448,8 @@ def render_college_explorer():
                             st.markdown(f"**Housing Cost:** ${inst['typical_housing_charge']:,.2f}/year")
 
                     with col2:
-                        if st.button("❤️", key=f"fav_{inst['unitid']}"):
-                            toggle_favorite(inst['unitid'])
+                        if st.button("❤️", key=f"fav_list_{inst['unitid']}"):
+                            toggle_favorite(inst['unitid'], scope="fragment")
 
                     st.markdown("---")
         except Exception as e:
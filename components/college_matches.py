@@ -1,14 +1,85 @@
 import streamlit as st
 from agents.counselor import CounselorAgent
+from models.database import Database
 from utils.error_handling import handle_error, APIError, DatabaseError
 import logging
-import json
+import orjson
 from datetime import datetime
 import traceback
 import time
+import asyncio
+import contextlib
+import fastjsonschema
 
 logger = logging.getLogger(__name__)
 
+# Walkthrough option lists, built once at import rather than on every rerun
+CLASS_SIZES = ("Small (< 20)", "Medium (20-50)", "Large (50+)", "No Preference")
+TEACHING_STYLES = ("Lecture-based", "Discussion-based", "Project-based", "Research-focused")
+CAMPUS_SETTINGS = ("Urban", "Suburban", "Rural", "No Preference")
+SPECIAL_PROGRAMS = ("Honors Program", "Study Abroad", "Internship Programs", "Research Opportunities")
+REGIONS = ("Northeast", "Southeast", "Midwest", "Southwest", "West Coast")
+CLIMATES = ("Warm", "Cold", "Moderate", "No Preference")
+HOUSING = ("On-campus", "Off-campus", "No Preference")
+ACTIVITIES = ("Sports", "Arts", "Music", "Theater", "Greek Life", "Cultural Organizations")
+ATHLETICS = ("Very Important", "Somewhat Important", "Not Important")
+
+# Shape render_college_card relies on; compiled once so each check is a single generated function call
+COLLEGE_SCHEMA = {
+    "type": "object",
+    "required": ["name", "match_score", "academic_fit", "program_strengths",
+                 "extracurricular_matches", "admission_stats", "why_good_fit"],
+    "properties": {
+        "name": {"type": "string"},
+        "match_score": {"type": "number"},
+        "academic_fit": {"type": "string"},
+        "program_strengths": {"type": "array", "items": {"type": "string"}},
+        "extracurricular_matches": {"type": "array", "items": {"type": "string"}},
+        "admission_stats": {
+            "type": "object",
+            "required": ["acceptance_rate", "gpa_range"],
+            "properties": {
+                "acceptance_rate": {"type": "number"},
+                "gpa_range": {
+                    "type": "object",
+                    "required": ["min", "max"],
+                    "properties": {"min": {"type": "number"}, "max": {"type": "number"}}
+                }
+            }
+        },
+        "why_good_fit": {"type": "string"}
+    }
+}
+_COLLEGE_VALIDATOR = fastjsonschema.compile(COLLEGE_SCHEMA)
+_MATCHES_VALIDATOR = fastjsonschema.compile({
+    "type": "object",
+    "required": ["colleges"],
+    "properties": {"colleges": {"type": "array", "items": COLLEGE_SCHEMA}}
+})
+
+@st.cache_resource(show_spinner=False)
+def get_counselor():
+    """Return a process-wide CounselorAgent so its API client is built once."""
+    return CounselorAgent()
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _load_cached_matches(user_id, profile_watermark, matches_watermark):
+    """Fetch a user's profile and cached matches, memoized until either watermark moves."""
+    record = Database().get_profile_and_matches(user_id)
+    return dict(record) if record else None
+
+def _matches_watermark(user_id):
+    """Return the updated_at of a user's profile and college matches.
+
+    Profile and match writes both set updated_at, so a save from any session moves
+    the watermark and the cached lookup keyed on it is re-run.
+    """
+    return Database().prepared_execute("matches_watermark_sel", """
+        SELECT
+            (SELECT updated_at FROM profiles WHERE user_id = $1) AS profile,
+            (SELECT updated_at FROM college_matches WHERE user_id = $1) AS matches
+    """, (user_id,))[0]
+
 def show_error_message(error_message, error_trace=None):
     """Display an error message with expandable details."""
     st.error(error_message)
@@ -16,8 +87,146 @@ def show_error_message(error_message, error_trace=None):
         with st.expander("Show Error Details"):
             st.code(error_trace)
 
-def show_walkthrough():
-    """Display the college match recommendation walkthrough."""
+def render_college_card(college):
+    """Render a single college match inside an expander."""
+    with st.expander(f"📚 {college['name']} - Match Score: {college['match_score']:.0%}"):
+        col1, col2 = st.columns(2)
+
+        # Each column's text goes out as one markdown element rather than one per line
+        with col1:
+            strengths = "\n".join(f"- {strength}" for strength in college['program_strengths'])
+            st.markdown(
+                f"### Why it's a good fit\n{college['why_good_fit']}\n\n"
+                f"### Program Strengths\n{strengths}"
+            )
+
+        with col2:
+            st.markdown(f"### Academic Fit\n{college['academic_fit']}\n\n### Admission Stats")
+            stats = college['admission_stats']
+            st.metric("Acceptance Rate", f"{stats['acceptance_rate']:.1%}")
+            ec_matches = "\n".join(f"- {match}" for match in college['extracurricular_matches'])
+            st.markdown(
+                f"GPA Range: {stats['gpa_range']['min']:.1f} - {stats['gpa_range']['max']:.1f}\n\n"
+                f"### Extracurricular Matches\n{ec_matches}"
+            )
+
+def stream_college_matches(counselor, profile):
+    """Render colleges as the counselor streams them and return the complete matches."""
+    colleges = []
+
+    async def consume():
+        # aclosing shuts the stream and its HTTP client down even when validation fails mid-stream
+        async with contextlib.aclosing(counselor.generate_college_matches_stream(profile)) as stream:
+            async for college in stream:
+                _COLLEGE_VALIDATOR(college)
+                colleges.append(college)
+                render_college_card(college)
+
+    asyncio.run(consume())
+
+    return {'colleges': colleges}
+
+def _render_preferences_step():
+    """Render the academic preferences step."""
+    st.markdown("### Academic Preferences")
+    col1, col2 = st.columns(2)
+    with col1:
+        st.selectbox(
+            "Preferred Class Size",
+            CLASS_SIZES,
+            key="class_size"
+        )
+        st.multiselect(
+            "Preferred Teaching Style",
+            TEACHING_STYLES,
+            key="teaching_style"
+        )
+    with col2:
+        st.selectbox(
+            "Campus Setting",
+            CAMPUS_SETTINGS,
+            key="campus_setting"
+        )
+        st.multiselect(
+            "Special Programs Interest",
+            SPECIAL_PROGRAMS,
+            key="special_programs"
+        )
+
+def _render_location_step():
+    """Render the location preferences step."""
+    st.markdown("### Location Preferences")
+    st.multiselect(
+        "Preferred Regions",
+        REGIONS,
+        key="regions"
+    )
+    st.slider(
+        "Maximum Distance from Home (miles)",
+        0, 3000, 500,
+        key="max_distance"
+    )
+    st.multiselect(
+        "Preferred Climate",
+        CLIMATES,
+        key="climate"
+    )
+
+def _render_campus_life_step():
+    """Render the campus life preferences step."""
+    st.markdown("### Campus Life Preferences")
+    col1, col2 = st.columns(2)
+    with col1:
+        st.selectbox(
+            "Housing Preference",
+            HOUSING,
+            key="housing"
+        )
+        st.multiselect(
+            "Important Campus Activities",
+            ACTIVITIES,
+            key="activities"
+        )
+    with col2:
+        st.selectbox(
+            "Athletics Importance",
+            ATHLETICS,
+            key="athletics"
+        )
+        st.slider(
+            "Importance of Campus Diversity (1-5)",
+            1, 5, 3,
+            key="diversity"
+        )
+
+def _render_review_step():
+    """Render a summary of the answers collected so far."""
+    st.markdown("### Review Your Preferences")
+    if st.session_state.walkthrough_data:
+        for category, preferences in st.session_state.walkthrough_data.items():
+            st.markdown(f"**{category}**")
+            if isinstance(preferences, (list, tuple)):
+                for pref in preferences:
+                    st.markdown(f"- {pref}")
+            else:
+                st.markdown(f"- {preferences}")
+
+STEPS = ("Preferences", "Location", "Campus Life", "Review")
+_STEP_DIVISOR = len(STEPS) - 1
+STEP_RENDERERS = (_render_preferences_step, _render_location_step, _render_campus_life_step, _render_review_step)
+
+# (walkthrough_data label, widget key) pairs copied when leaving each step
+STEP_FIELDS = (
+    (("Class Size", "class_size"), ("Teaching Style", "teaching_style"),
+     ("Campus Setting", "campus_setting"), ("Special Programs", "special_programs")),
+    (("Preferred Regions", "regions"), ("Maximum Distance", "max_distance"), ("Climate", "climate")),
+    (("Housing", "housing"), ("Campus Activities", "activities"),
+     ("Athletics", "athletics"), ("Diversity Importance", "diversity")),
+    (),
+)
+
+def show_walkthrough(profile):
+    """Display the college match recommendation walkthrough for the given profile."""
     try:
         st.subheader("🎯 Find Your Best College Matches")
 
@@ -28,91 +237,11 @@ def show_walkthrough():
             st.session_state.walkthrough_data = {}
 
         # Progress bar
-        steps = ["Preferences", "Location", "Campus Life", "Review"]
-        progress = st.session_state.walkthrough_step / (len(steps) - 1)
-        st.progress(progress, f"Step {st.session_state.walkthrough_step + 1} of {len(steps)}")
+        step = st.session_state.walkthrough_step
+        st.progress(step / _STEP_DIVISOR, f"Step {step + 1} of {len(STEPS)}")
 
         # Step content
-        if st.session_state.walkthrough_step == 0:
-            st.markdown("### Academic Preferences")
-            col1, col2 = st.columns(2)
-            with col1:
-                st.selectbox(
-                    "Preferred Class Size",
-                    ["Small (< 20)", "Medium (20-50)", "Large (50+)", "No Preference"],
-                    key="class_size"
-                )
-                st.multiselect(
-                    "Preferred Teaching Style",
-                    ["Lecture-based", "Discussion-based", "Project-based", "Research-focused"],
-                    key="teaching_style"
-                )
-            with col2:
-                st.selectbox(
-                    "Campus Setting",
-                    ["Urban", "Suburban", "Rural", "No Preference"],
-                    key="campus_setting"
-                )
-                st.multiselect(
-                    "Special Programs Interest",
-                    ["Honors Program", "Study Abroad", "Internship Programs", "Research Opportunities"],
-                    key="special_programs"
-                )
-
-        elif st.session_state.walkthrough_step == 1:
-            st.markdown("### Location Preferences")
-            st.multiselect(
-                "Preferred Regions",
-                ["Northeast", "Southeast", "Midwest", "Southwest", "West Coast"],
-                key="regions"
-            )
-            st.slider(
-                "Maximum Distance from Home (miles)",
-                0, 3000, 500,
-                key="max_distance"
-            )
-            st.multiselect(
-                "Preferred Climate",
-                ["Warm", "Cold", "Moderate", "No Preference"],
-                key="climate"
-            )
-
-        elif st.session_state.walkthrough_step == 2:
-            st.markdown("### Campus Life Preferences")
-            col1, col2 = st.columns(2)
-            with col1:
-                st.selectbox(
-                    "Housing Preference",
-                    ["On-campus", "Off-campus", "No Preference"],
-                    key="housing"
-                )
-                st.multiselect(
-                    "Important Campus Activities",
-                    ["Sports", "Arts", "Music", "Theater", "Greek Life", "Cultural Organizations"],
-                    key="activities"
-                )
-            with col2:
-                st.selectbox(
-                    "Athletics Importance",
-                    ["Very Important", "Somewhat Important", "Not Important"],
-                    key="athletics"
-                )
-                st.slider(
-                    "Importance of Campus Diversity (1-5)",
-                    1, 5, 3,
-                    key="diversity"
-                )
-
-        else:  # Review step
-            st.markdown("### Review Your Preferences")
-            if st.session_state.walkthrough_data:
-                for category, preferences in st.session_state.walkthrough_data.items():
-                    st.markdown(f"**{category}**")
-                    if isinstance(preferences, (list, tuple)):
-                        for pref in preferences:
-                            st.markdown(f"- {pref}")
-                    else:
-                        st.markdown(f"- {preferences}")
+        STEP_RENDERERS[st.session_state.walkthrough_step]()
 
         # Navigation buttons
         col1, col2 = st.columns(2)
@@ -123,77 +252,49 @@ def show_walkthrough():
                     st.rerun()
 
         with col2:
-            if st.session_state.walkthrough_step < len(steps) - 1:
+            if st.session_state.walkthrough_step < _STEP_DIVISOR:
                 if st.button("Next →"):
                     try:
                         # Save current step data
-                        current_step_data = {}
-                        if st.session_state.walkthrough_step == 0:
-                            current_step_data = {
-                                "Class Size": st.session_state.class_size,
-                                "Teaching Style": st.session_state.teaching_style,
-                                "Campus Setting": st.session_state.campus_setting,
-                                "Special Programs": st.session_state.special_programs
-                            }
-                        elif st.session_state.walkthrough_step == 1:
-                            current_step_data = {
-                                "Preferred Regions": st.session_state.regions,
-                                "Maximum Distance": st.session_state.max_distance,
-                                "Climate": st.session_state.climate
-                            }
-                        elif st.session_state.walkthrough_step == 2:
-                            current_step_data = {
-                                "Housing": st.session_state.housing,
-                                "Campus Activities": st.session_state.activities,
-                                "Athletics": st.session_state.athletics,
-                                "Diversity Importance": st.session_state.diversity
-                            }
-
-                        st.session_state.walkthrough_data.update(current_step_data)
+                        wd = st.session_state.walkthrough_data
+                        for label, key in STEP_FIELDS[st.session_state.walkthrough_step]:
+                            wd[label] = st.session_state[key]
+
                         st.session_state.walkthrough_step += 1
                         st.rerun()
                     except Exception as e:
-                        error_trace = traceback.format_exc()
-                        logger.error(f"Error saving walkthrough step data: {str(e)}\n{error_trace}")
-                        show_error_message("Error saving your preferences", error_trace)
+                        logger.exception(f"Error saving walkthrough step data: {str(e)}")
+                        show_error_message("Error saving your preferences", traceback.format_exc())
             elif st.button("Generate Recommendations", type="primary"):
                 try:
                     with st.spinner("🎓 Generating your personalized college matches..."):
-                        generate_recommendations(st.session_state.walkthrough_data)
+                        generate_recommendations(st.session_state.walkthrough_data, profile)
 
                 except Exception as e:
-                    error_trace = traceback.format_exc()
-                    logger.error(f"Error generating recommendations: {str(e)}\n{error_trace}")
-                    show_error_message("Unable to generate recommendations", error_trace)
+                    logger.exception(f"Error generating recommendations: {str(e)}")
+                    show_error_message("Unable to generate recommendations", traceback.format_exc())
 
     except Exception as e:
-        error_trace = traceback.format_exc()
-        logger.error(f"Error in walkthrough: {str(e)}\n{error_trace}")
-        show_error_message("Something went wrong in the walkthrough", error_trace)
+        logger.exception(f"Error in walkthrough: {str(e)}")
+        show_error_message("Something went wrong in the walkthrough", traceback.format_exc())
 
-def generate_recommendations(preferences):
-    """Generate college recommendations based on walkthrough preferences."""
+def generate_recommendations(preferences, profile):
+    """Generate college recommendations from the already-loaded profile and walkthrough preferences."""
     try:
         with st.spinner("🎓 Generating your personalized college matches..."):
-            counselor = CounselorAgent()
-            profile = st.session_state.user.get_profile()
+            counselor = get_counselor()
 
             # Combine profile data with walkthrough preferences
-            enhanced_profile = {
-                **(profile or {}),  # Handle case where profile is None
-                "preferences": preferences
-            }
+            enhanced_profile = dict(profile) if profile else {}  # Handle case where profile is None
+            enhanced_profile["preferences"] = preferences
 
             # Generate recommendations
-            matches_json = counselor.generate_college_matches(enhanced_profile)
-            matches = json.loads(matches_json)  # Convert JSON string to dict
+            matches = counselor.generate_college_matches_dict(enhanced_profile)
+            _MATCHES_VALIDATOR(matches)
 
-            # Store in database
+            # Store in database; the dict is adapted to jsonb directly
             db = st.session_state.user.db
-            db.execute("""
-                INSERT INTO college_matches (user_id, matches)
-                VALUES (%s, %s)
-            """, (st.session_state.user.id, matches_json))  # Store original JSON string
+            db.save_college_matches(st.session_state.user.id, matches)
 
             logger.info(f"Generated new college matches for user {st.session_state.user.id} with preferences")
             st.session_state.walkthrough_complete = True
@@ -205,26 +306,32 @@ def generate_recommendations(preferences):
             st.rerun()
 
     except Exception as e:
-        error_trace = traceback.format_exc()
-        logger.error(f"Error generating recommendations: {str(e)}\n{error_trace}")
-        show_error_message("Unable to generate recommendations", error_trace)
+        logger.exception(f"Error generating recommendations: {str(e)}")
+        show_error_message("Unable to generate recommendations", traceback.format_exc())
 
 @handle_error
 def render_college_matches():
     """Render personalized college recommendations."""
-    if not hasattr(st.session_state, 'user'):
+    if 'user' not in st.session_state:
         st.warning("Please log in to see personalized college recommendations.")
         return
 
     st.title("College Matches")
 
     try:
-        profile = st.session_state.user.get_profile()
+        db = st.session_state.user.db
+
+        # Profile and latest cached matches come back in one round trip, and
+        # are only re-queried once either row's updated_at moves
+        user_id = st.session_state.user.id
+        watermark = _matches_watermark(user_id)
+        record = _load_cached_matches(user_id, watermark['profile'], watermark['matches'])
+        profile = record['profile'] if record else None
         if not profile:
             st.warning("Please complete your profile to get personalized college recommendations.")
             return
 
-        db = st.session_state.user.db
+        cached_colleges = record['colleges']
 
         # Show walkthrough or matches
         if 'active_tab' not in st.session_state:
@@ -243,114 +350,70 @@ def render_college_matches():
             with col1:
                 st.write("Your personalized college matches based on your profile")
             with col2:
+                # Regenerating moves the matches watermark, so no cache clear is needed
                 force_refresh = st.button("🔄 Refresh Matches")
 
             try:
                 # Check for cached matches
-                cached_record = None if force_refresh else db.execute_one("""
-                    SELECT matches, updated_at 
-                    FROM college_matches 
-                    WHERE user_id = %s 
-                    ORDER BY updated_at DESC 
-                    LIMIT 1
-                """, (st.session_state.user.id,))
+                cached_record = None if force_refresh or record['updated_at'] is None else record
 
                 matches = None
+                streamed = False
                 # Generate new matches if needed
                 if not cached_record or force_refresh:
                     with st.spinner("Generating personalized college matches..."):
-                        counselor = CounselorAgent()
-                        matches_json = counselor.generate_college_matches(profile)
-
-                        try:
-                            # Parse and validate JSON
-                            matches = json.loads(matches_json)
-                            if not isinstance(matches, dict) or 'colleges' not in matches:
-                                raise ValueError("Invalid matches structure")
-
-                            # Store in database as JSON string
-                            db.execute("""
-                                INSERT INTO college_matches (user_id, matches)
-                                VALUES (%s, %s)
-                            """, (st.session_state.user.id, matches_json))
-
-                            logger.info(f"Generated and cached new college matches for user {st.session_state.user.id}")
-                        except json.JSONDecodeError as e:
-                            logger.error(f"Invalid JSON from counselor: {str(e)}")
-                            raise APIError("Error processing college recommendations")
-                        except ValueError as e:
-                            logger.error(f"Invalid matches structure: {str(e)}")
+                        counselor = get_counselor()
+
+                        # Colleges are rendered as they arrive; persist only once the stream completes
+                        matches = stream_college_matches(counselor, profile)
+                        streamed = True
+                        if not matches['colleges']:
+                            logger.error("Invalid matches structure: no colleges in counselor response")
                             raise APIError("Invalid college recommendations format")
+
+                        # Store in database; the dict is adapted to jsonb directly
+                        db.save_college_matches(st.session_state.user.id, matches)
+
+                        logger.info(f"Generated and cached new college matches for user {st.session_state.user.id}")
                 else:
                     try:
-                        # Handle cached matches - could be string or dict
-                        cached_matches = cached_record['matches']
-                        if isinstance(cached_matches, str):
-                            matches = json.loads(cached_matches)
-                        elif isinstance(cached_matches, dict):
-                            matches = cached_matches
-                        else:
-                            raise ValueError(f"Unexpected matches type: {type(cached_matches)}")
-
-                        if not isinstance(matches, dict) or 'colleges' not in matches:
-                            raise ValueError("Invalid cached matches structure")
+                        # JSONB sub-tree is already decoded to a list by psycopg2
+                        matches = _MATCHES_VALIDATOR({'colleges': cached_colleges})
 
                         st.caption(f"Last updated: {cached_record['updated_at'].strftime('%Y-%m-%d %H:%M')}")
-                    except (json.JSONDecodeError, ValueError) as e:
+                    except ValueError as e:
                         logger.error(f"Error loading cached matches: {str(e)}")
                         raise DatabaseError("Error loading cached recommendations")
 
-                # Display college matches
-                if matches and 'colleges' in matches:
-                    for college in matches['colleges']:
-                        with st.expander(f"📚 {college['name']} - Match Score: {college['match_score']:.0%}"):
-                            col1, col2 = st.columns(2)
-
-                            with col1:
-                                st.markdown("### Why it's a good fit")
-                                st.write(college['why_good_fit'])
-
-                                st.markdown("### Program Strengths")
-                                for strength in college['program_strengths']:
-                                    st.markdown(f"- {strength}")
-
-                            with col2:
-                                st.markdown("### Academic Fit")
-                                st.write(college['academic_fit'])
-
-                                st.markdown("### Admission Stats")
-                                stats = college['admission_stats']
-                                st.metric("Acceptance Rate", f"{stats['acceptance_rate']:.1%}")
-                                st.write(f"GPA Range: {stats['gpa_range']['min']:.1f} - {stats['gpa_range']['max']:.1f}")
-
-                                st.markdown("### Extracurricular Matches")
-                                for match in college['extracurricular_matches']:
-                                    st.markdown(f"- {match}")
+                # Display college matches (streamed matches were rendered as they arrived)
+                if matches['colleges']:
+                    if not streamed:
+                        for college in matches['colleges']:
+                            render_college_card(college)
 
                     logger.info(f"Displayed college matches for user {st.session_state.user.id}")
                 else:
                     st.warning("No college matches found. Try refreshing or generating new matches.")
 
-            except (json.JSONDecodeError, ValueError) as e:
-                error_trace = traceback.format_exc()
-                logger.error(f"JSON structure error: {str(e)}\n{error_trace}")
-                show_error_message("Error processing college matches data", error_trace)
+            except (orjson.JSONDecodeError, ValueError) as e:
+                logger.exception(f"JSON structure error: {str(e)}")
+                show_error_message("Error processing college matches data", traceback.format_exc())
             except APIError as e:
-                error_trace = traceback.format_exc()
-                logger.error(f"API error: {str(e)}\n{error_trace}")
-                show_error_message(str(e), error_trace)
+                logger.exception(f"API error: {str(e)}")
+                show_error_message(str(e), traceback.format_exc())
             except DatabaseError as e:
-                error_trace = traceback.format_exc()
-                logger.error(f"Database error: {str(e)}\n{error_trace}")
-                show_error_message(str(e), error_trace)
+                logger.exception(f"Database error: {str(e)}")
+                show_error_message(str(e), traceback.format_exc())
 
         with tab2:
-            show_walkthrough()
+            show_walkthrough(profile)
 
     except Exception as e:
-        error_trace = traceback.format_exc()
-        logger.error(f"Unexpected error in college matches: {str(e)}\n{error_trace}")
-        show_error_message("Something went wrong while displaying college matches.", error_trace)
+        logger.exception(f"Unexpected error in college matches: {str(e)}")
+        show_error_message("Something went wrong while displaying college matches.", traceback.format_exc())
+
+# Make sure the functions are properly exported
+__all__ = ['render_college_matches']
 
 if __name__ == "__main__":
     render_college_matches()
\ No newline at end of file
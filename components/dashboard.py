@@ -1,6 +1,6 @@
 import streamlit as st
 from components.profile import render_profile
-from components.chat import render_chat, new_chat_session
+from components.chat import render_chat, new_chat_session, get_cached_chat_sessions
 from components.achievements import render_achievements
 from components.college_matches import render_college_matches
 from components.timeline import render_timeline
@@ -20,14 +20,30 @@ def show_error_message(error_message: str, error_trace: str = None):
         with st.expander("Show Error Details"):
             st.code(error_trace)
 
+DASHBOARD_SECTIONS = ("Chat", "College Explorer", "College Matches", "Timeline", "Internships", "Profile")
+SECTION_RENDERERS = {
+    "Chat": render_chat,
+    "College Explorer": render_college_explorer,
+    "College Matches": render_college_matches,
+    "Timeline": render_timeline,
+    "Internships": render_internships,
+    "Profile": render_profile,
+}
+
+@st.cache_resource(show_spinner=False)
+def init_default_achievements():
+    """Seed the default achievements once per server process; failures are not cached and retry on the next run."""
+    Achievement.initialize_default_achievements()
+    return True
+
 @handle_error
 def render_dashboard():
     """Renders the main dashboard interface of the College Compass application."""
     st.title("College Compass Dashboard")
 
     try:
-        # Initialize achievements if needed
-        Achievement.initialize_default_achievements()
+        # Initialize achievements once per process
+        init_default_achievements()
     except DatabaseError as e:
         error_trace = traceback.format_exc()
         logger.error(f"Failed to initialize achievements: {str(e)}\n{error_trace}")
@@ -43,9 +59,9 @@ def render_dashboard():
             logger.info("Started new chat session")
 
         st.subheader("Recent Sessions")
-        if hasattr(st.session_state, 'user'):
+        if 'user' in st.session_state:
             try:
-                sessions = st.session_state.user.get_chat_sessions()
+                sessions = get_cached_chat_sessions(st.session_state.user.id)
                 for session in sessions:
                     if st.button(f"📝 {session['title']}", key=f"session_{session['id']}"):
                         #load_chat_session(session['id'])  #load_chat_session removed as per the edit
@@ -57,37 +73,16 @@ def render_dashboard():
                 show_error_message("Unable to load chat history", error_trace)
 
     with col2:
-        # Initialize active tab if not present
-        if 'active_tab' not in st.session_state:
-            st.session_state.active_tab = "Chat"
-
-        # Create tabs
-        tabs = st.tabs(["Chat", "College Explorer", "College Matches", "Timeline", "Internships", "Profile"])
-
-        # Render content for each tab
-        with tabs[0]:  # Chat tab
-            render_chat()
-
-        with tabs[1]:  # College Explorer tab
-            render_college_explorer()
-
-        with tabs[2]:  # College Matches tab
-            render_college_matches()
-
-        with tabs[3]:  # Timeline tab
-            render_timeline()
-
-        with tabs[4]:  # Internships tab
-            render_internships()
-
-        with tabs[5]:  # Profile tab
-            render_profile()
+        # Only the selected section is rendered; st.tabs would run every body on each rerun
+        section = st.radio(
+            "Section",
+            DASHBOARD_SECTIONS,
+            horizontal=True,
+            label_visibility="collapsed",
+            key="dashboard_section"
+        )
+        SECTION_RENDERERS[section]()
 
     with col3:
         # Render achievements panel
         render_achievements()
-
-# Make render_dashboard available at the module level
-# This ensures it can be imported directly
-if not globals().get('render_dashboard'):
-    globals()['render_dashboard'] = render_dashboard
\ No newline at end of file
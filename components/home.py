@@ -1,6 +1,16 @@
 import streamlit as st
 from streamlit_lottie import st_lottie
-import os
+from pathlib import Path
+
+COCO_IMAGE = Path(__file__).resolve().parent.parent / "static" / "coco.webp"
+
+# Served by Streamlit's static file server, so the browser fetches and caches it once
+COCO_IMAGE_URL = f"./app/static/{COCO_IMAGE.name}"
+
+# Read once at import and inlined on every run; Streamlit's static server sends
+# .css as text/plain with nosniff, which browsers refuse to apply as a stylesheet
+HOME_CSS = Path(__file__).resolve().parent.parent / "static" / "home.css"
+_HOME_STYLE = f"<style>{HOME_CSS.read_text(encoding='utf-8')}</style>"
 
 def render_hero_section():
     """Render the hero section with Coco's avatar and main message"""
@@ -24,8 +34,13 @@ def render_hero_section():
     # Center the avatar and CTA
     col1, col2, col3 = st.columns([1, 2, 1])
     with col2:
-        image_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "images", "coco.webp")
-        st.image(image_path, use_container_width=True)
+        # Above the fold: load eagerly at high priority, with intrinsic size so layout does not shift
+        st.markdown(
+            f'<img src="{COCO_IMAGE_URL}" width="1024" height="1024" '
+            'loading="eager" fetchpriority="high" decoding="async" alt="Coco, your AI college counselor" '
+            'style="width: 100%; height: auto;">',
+            unsafe_allow_html=True
+        )
 
         # Call to action button
         if st.button(
@@ -69,11 +84,11 @@ def render_key_features():
 def render_navigation():
     """Render the navigation menu"""
     menu_items = {
-        "Home": "/",
-        "Login": "1_🔑_login",
-        "Resources": "2_📚_resources",
-        "Blog": "3_📝_blog",
-        "About": "4_ℹ️_about"
+        "Home": "main.py",
+        "Login": "pages/1_ð_login.py",
+        "Resources": "pages/2_ð_resources.py",
+        "Blog": "pages/3_ð_blog.py",
+        "About": "pages/4_â¹ï¸_about.py"
     }
 
     # Create a horizontal navigation bar
@@ -87,19 +102,15 @@ def render_navigation():
         unsafe_allow_html=True
     )
 
-    # Add navigation links
+    # Add navigation links; page_link renders a plain link, so navigating needs no extra rerun
     cols = st.columns(len(menu_items))
-    for i, (label, page) in enumerate(menu_items.items()):
-        with cols[i]:
-            if st.button(label, key=f"nav-{page}", use_container_width=True):
-                if page == "/":
-                    st.switch_page("main")
-                else:
-                    st.switch_page(f"pages/{page}")
+    for col, (label, page) in zip(cols, menu_items.items()):
+        with col:
+            st.page_link(page, label=label, use_container_width=True)
 
 def render_demo_mode_indicator():
     """Show demo mode banner"""
-    if not hasattr(st.session_state, 'user') or st.session_state.user is None:
+    if 'user' not in st.session_state or st.session_state.user is None:
         st.warning(
             "🚀 Demo Mode: Experience Coco's capabilities! No login required.",
             icon="📝"
@@ -108,108 +119,7 @@ def render_demo_mode_indicator():
 def render_home():
     """Main function to render the homepage"""
     # Custom CSS for styling
-    st.markdown(
-        """
-        <style>
-        /* Global Styles */
-        [data-testid="stAppViewContainer"] {
-            background-color: #FFFFFF;
-        }
-
-        /* Navigation Styles */
-        .navigation-bar {
-            background-color: #FFFFFF;
-            padding: 1rem 0;
-            border-bottom: 1px solid #EAEAEA;
-            margin-bottom: 2rem;
-        }
-
-        .nav-content {
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            max-width: 1200px;
-            margin: 0 auto;
-        }
-
-        .nav-logo {
-            font-size: 24px;
-            font-weight: bold;
-            color: #2E4057;
-        }
-
-        /* Hero Section Styles */
-        .hero-section {
-            text-align: center;
-            padding: 2rem 0;
-            max-width: 800px;
-            margin: 0 auto;
-        }
-
-        .hero-content h1 {
-            font-size: 48px;
-            font-weight: bold;
-            color: #2E4057;
-            margin-bottom: 1rem;
-            line-height: 1.2;
-        }
-
-        .hero-content h2 {
-            font-size: 24px;
-            color: #4A4A4A;
-            margin-bottom: 2rem;
-        }
-
-        .hero-description {
-            font-size: 18px;
-            color: #666666;
-            margin-bottom: 2rem;
-            line-height: 1.6;
-        }
-
-        /* Button Styles */
-        .stButton > button {
-            background-color: #FF4B4B;
-            color: white;
-            font-size: 18px;
-            padding: 1rem 2rem;
-            border-radius: 8px;
-            border: none;
-            transition: background-color 0.3s ease;
-        }
-
-        .stButton > button:hover {
-            background-color: #FF6B6B;
-            border-color: #FF4B4B;
-        }
-
-        /* Features Section Styles */
-        h2 {
-            color: #2E4057;
-            font-size: 36px;
-            text-align: center;
-            margin: 3rem 0;
-        }
-
-        h3 {
-            color: #2E4057;
-            font-size: 24px;
-            margin-bottom: 1rem;
-        }
-
-        /* Warning Banner Styles */
-        .stAlert {
-            background-color: #FFF3CD;
-            color: #856404;
-            border-color: #FFEEBA;
-            padding: 1rem;
-            margin-bottom: 2rem;
-            border-radius: 8px;
-        }
-        </style>
-        """,
-        unsafe_allow_html=True
-    )
+    st.markdown(_HOME_STYLE, unsafe_allow_html=True)
 
     # Show demo mode indicator if needed
     render_demo_mode_indicator()
@@ -1,10 +1,11 @@
 import streamlit as st
 from models.database import Database
-from datetime import datetime
+from psycopg2.extras import Json
 import logging
-import json
+import itertools
 import traceback
-from typing import Dict, List
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, List, Optional
 import pandas as pd
 
 logger = logging.getLogger(__name__)
@@ -16,127 +17,267 @@ def show_error_message(error_message, error_trace=None):
         with st.expander("Show Error Details"):
             st.code(error_trace)
 
+_SAMPLE_PROGRAMS = [
+    {
+        'name': 'California State Summer School for Mathematics and Science (COSMOS)',
+        'organization': 'University of California',
+        'description': 'Four-week summer residential program for students with demonstrated interest in STEM.',
+        'website_url': 'https://cosmos.ucsc.edu/',
+        'program_type': 'Summer Research',
+        'subject_areas': ['Mathematics', 'Science', 'Engineering'],
+        'grade_levels': ['10th Grade', '11th Grade'],
+        'application_deadline': '2025-02-15',
+        'program_duration': '4 weeks',
+        'location_type': 'In-person',
+        'locations': ['UC Davis', 'UC Irvine', 'UC San Diego', 'UC Santa Cruz'],
+        'requirements': {
+            'gpa_minimum': 3.5,
+            'materials': [
+                'Application Form',
+                'Teacher Recommendation',
+                'Transcript',
+                'Personal Statement'
+            ]
+        }
+    }
+]
+
+# Insert parameters built once at import: arrays stay lists (adapted to text[]) and
+# requirements are wrapped in the Json adapter
+_SAMPLE_PROGRAM_ROWS = [
+    {**program, 'requirements': Json(program['requirements'])}
+    for program in _SAMPLE_PROGRAMS
+]
+
+@st.cache_resource(show_spinner=False)
+def _seed_sample_programs():
+    """Insert the sample internship programs if none exist, once per server process.
+
+    The emptiness check and the insert are one statement, so seeding costs a single
+    round trip and runs in a single transaction (the sample list is well under one
+    execute_values page, which later pages would otherwise skip). Errors propagate so that a failed
+    attempt is not cached and is retried on the next run.
+    """
+    db = Database()
+    db.execute_many("""
+        INSERT INTO internship_programs (
+            name, organization, description, website_url, program_type,
+            subject_areas, grade_levels, application_deadline,
+            program_duration, location_type, locations, requirements
+        )
+        SELECT * FROM (VALUES %s) AS v
+        WHERE NOT EXISTS (SELECT 1 FROM internship_programs)
+    """, _SAMPLE_PROGRAM_ROWS, template="""(
+        %(name)s, %(organization)s, %(description)s, %(website_url)s,
+        %(program_type)s, %(subject_areas)s::text[], %(grade_levels)s::text[],
+        %(application_deadline)s::date, %(program_duration)s, %(location_type)s,
+        %(locations)s::text[], %(requirements)s::jsonb
+    )""")
+
+    _fetch_programs.clear()
+    logger.info("Sample internship programs initialized")
+    return True
+
 def initialize_sample_programs():
     """Initialize sample internship programs if none exist."""
     try:
-        db = Database()
-        count = db.execute_one("SELECT COUNT(*) as count FROM internship_programs")
-
-        if count['count'] == 0:
-            sample_programs = [
-                {
-                    'name': 'California State Summer School for Mathematics and Science (COSMOS)',
-                    'organization': 'University of California',
-                    'description': 'Four-week summer residential program for students with demonstrated interest in STEM.',
-                    'website_url': 'https://cosmos.ucsc.edu/',
-                    'program_type': 'Summer Research',
-                    'subject_areas': ['Mathematics', 'Science', 'Engineering'],
-                    'grade_levels': ['10th Grade', '11th Grade'],
-                    'application_deadline': '2025-02-15',
-                    'program_duration': '4 weeks',
-                    'location_type': 'In-person',
-                    'locations': ['UC Davis', 'UC Irvine', 'UC San Diego', 'UC Santa Cruz'],
-                    'requirements': {
-                        'gpa_minimum': 3.5,
-                        'materials': [
-                            'Application Form',
-                            'Teacher Recommendation',
-                            'Transcript',
-                            'Personal Statement'
-                        ]
-                    }
-                }
-            ]
-
-            for program in sample_programs:
-                try:
-                    # Convert requirements to JSON, leave arrays as arrays
-                    program_data = {
-                        'name': program['name'],
-                        'organization': program['organization'],
-                        'description': program['description'],
-                        'website_url': program['website_url'],
-                        'program_type': program['program_type'],
-                        'subject_areas': program['subject_areas'],  # Keep as array
-                        'grade_levels': program['grade_levels'],    # Keep as array
-                        'application_deadline': program['application_deadline'],
-                        'program_duration': program['program_duration'],
-                        'location_type': program['location_type'],
-                        'locations': program['locations'],          # Keep as array
-                        'requirements': json.dumps(program['requirements'])  # Convert dict to JSON
-                    }
-
-                    db.execute("""
-                        INSERT INTO internship_programs (
-                            name, organization, description, website_url, program_type,
-                            subject_areas, grade_levels, application_deadline,
-                            program_duration, location_type, locations, requirements
-                        ) VALUES (
-                            %(name)s, %(organization)s, %(description)s, %(website_url)s,
-                            %(program_type)s, %(subject_areas)s, %(grade_levels)s,
-                            %(application_deadline)s, %(program_duration)s, %(location_type)s,
-                            %(locations)s, %(requirements)s::jsonb
-                        )
-                    """, program_data)
-
-                except Exception as e:
-                    logger.error(f"Error inserting program {program['name']}: {str(e)}")
-                    continue
-
-            logger.info("Sample internship programs initialized")
-
+        _seed_sample_programs()
     except Exception as e:
         error_trace = traceback.format_exc()
         logger.error(f"Error initializing sample programs: {str(e)}\n{error_trace}")
         show_error_message("Failed to initialize sample programs", error_trace)
 
-def get_student_interests() -> List[str]:
+@st.cache_data(ttl=300, show_spinner=False)
+def _get_student_interests(user_id) -> FrozenSet[str]:
+    """Fetch a user's interests and target majors, cached per user id.
+
+    Returned as a frozenset: immutable, so the cached value cannot be changed by a
+    caller, and ready for set intersection. Cleared through clear_student_interests_cache.
+    """
+    db = Database()
+    profile = db.execute_one("""
+        SELECT interests, target_majors
+        FROM profiles
+        WHERE user_id = %s
+    """, (user_id,))
+
+    if not profile:
+        return frozenset()
+
+    # TEXT[] columns are already decoded to lists by psycopg2
+    return frozenset(profile['interests'] or ()) | frozenset(profile['target_majors'] or ())
+
+def clear_student_interests_cache():
+    """Drop cached student interests, e.g. after the profile is saved."""
+    _get_student_interests.clear()
+
+def get_student_interests() -> FrozenSet[str]:
     """Get student's interests from their profile."""
     try:
-        if not hasattr(st.session_state, 'user'):
-            return []
-
-        db = Database()
-        profile = db.execute_one("""
-            SELECT interests, target_majors
-            FROM profiles
-            WHERE user_id = %s
-        """, (st.session_state.user.id,))
-
-        if not profile:
-            return []
-
-        interests = set()
-        if profile['interests']:
-            interests.update(json.loads(profile['interests']))
-        if profile['target_majors']:
-            interests.update(json.loads(profile['target_majors']))
-
-        return list(interests)
+        if 'user' not in st.session_state:
+            return frozenset()
+
+        return _get_student_interests(st.session_state.user.id)
     except Exception as e:
         logger.error(f"Error getting student interests: {str(e)}")
-        return []
+        return frozenset()
+
+def _build_program_query(by_type, by_subject, by_location):
+    """Build the programs query for one combination of active filters."""
+    conditions = []
+    if by_type:
+        conditions.append("ip.program_type = ANY(%(types)s)")
+    if by_subject:
+        # Array overlap can use the GIN index on subject_areas
+        conditions.append("ip.subject_areas && %(subjects)s::text[]")
+    if by_location:
+        conditions.append("ip.location_type = ANY(%(locations)s)")
+
+    # The user's application status comes back in the same round trip, and dates are
+    # formatted for display by Postgres (FMMonth drops the padding after the month name)
+    return """
+        SELECT ip.id, ip.name, ip.organization, ip.description, ip.website_url,
+            ip.program_duration, ip.location_type, ip.locations, ip.requirements,
+            ia.status AS app_status,
+            to_char(ip.application_deadline, 'FMMonth DD, YYYY') AS deadline_str,
+            to_char(ia.application_date, 'FMMonth DD, YYYY') AS app_date_str
+        FROM internship_programs ip
+        LEFT JOIN internship_applications ia
+            ON ia.program_id = ip.id AND ia.user_id = %(user_id)s
+        {}
+        ORDER BY ip.application_deadline;
+    """.format(" WHERE " + " AND ".join(conditions) if conditions else "")
+
+@dataclass(slots=True)
+class Program:
+    """One row of the program browser: the columns the card displays, without a per-row __dict__.
+
+    Not frozen: the card updates app_status in place after Mark Interested.
+    """
+    id: int
+    name: str
+    organization: str
+    description: Optional[str]
+    website_url: Optional[str]
+    program_duration: Optional[str]
+    location_type: Optional[str]
+    locations: Optional[List[str]]
+    requirements: Optional[Dict]
+    app_status: Optional[str]
+    deadline_str: Optional[str]
+    app_date_str: Optional[str]
+
+# One query per (types, subjects, locations) filter-presence combination, built at import
+_PROGRAM_QUERIES = {
+    flags: _build_program_query(*flags)
+    for flags in itertools.product((False, True), repeat=3)
+}
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _fetch_programs(types: tuple, subjects: tuple, locations: tuple, user_id) -> List[Program]:
+    """Fetch programs matching the filters along with the user's application status.
+
+    Filters are tuples so they can be cache keys; they are passed to SQL as lists
+    because psycopg2 adapts tuples to row literals rather than arrays.
+    """
+    db = Database()
+    query_params = {'user_id': user_id}
+    if types:
+        query_params['types'] = list(types)
+    if subjects:
+        query_params['subjects'] = list(subjects)
+    if locations:
+        query_params['locations'] = list(locations)
+
+    query = _PROGRAM_QUERIES[(bool(types), bool(subjects), bool(locations))]
+    return [Program(**program) for program in db.execute(query, query_params)]
+
+# Filter options, built once at import
+_PROGRAM_TYPES = (
+    "Summer Research", "Leadership Development",
+    "Research & Development", "Internship", "Workshop", "Fellowship"
+)
+_LOCATION_TYPES = ("Remote", "In-person", "Hybrid")
+
+# Subject areas offered as filters, in display order, plus a set for membership tests
+_SUBJECT_AREAS = (
+    "Mathematics", "Science", "Engineering", "Computer Science",
+    "Leadership", "Community Service", "Business", "Arts"
+)
+_SUBJECT_AREA_SET = frozenset(_SUBJECT_AREAS)
+
+@st.fragment
+def _program_card(program: Program):
+    """Render one program; its actions rerun only this card, not the whole page."""
+    st.markdown(
+        f"### 📋 {program.name}\n\n"
+        f"**Deadline:** {program.deadline_str}"
+    )
+
+    col1, col2 = st.columns([2, 1])
+
+    with col1:
+        # Static program details go out as a single markdown element
+        details = [
+            f"**Organization:** {program.organization}",
+            f"**Description:** {program.description}",
+            f"**Duration:** {program.program_duration}",
+            f"**Location Type:** {program.location_type}"
+        ]
 
-def render_program_browser(interests: List[str]):
-    """Render the program browser with filters."""
-    try:
-        st.subheader("Available Programs")
+        # No need for json.loads: locations is a TEXT[] and requirements a JSONB,
+        # both already decoded by psycopg2 (jsonb via the orjson loader registered in Database)
+        locations = program.locations
+        if locations:
+            details.append("**Locations:** " + ", ".join(locations))
+
+        details.append("---")
+        details.append("**📝 Requirements:**")
+        for key, value in (program.requirements or {}).items():
+            if isinstance(value, list):
+                details.append(f"**{key.title()}:**\n" + "\n".join(f"- {item}" for item in value))
+            else:
+                details.append(f"**{key.title()}:** {value}")
+
+        st.markdown("\n\n".join(details))
+
+    with col2:
+        # Application status is filled in after the action below so a write shows up without a rerun
+        status_slot = st.container()
+
+        # Action submitted through a per-program form with a unique key
+        with st.form(f"program_interested_{program.id}", border=False):
+            if st.form_submit_button("Mark Interested"):
+                try:
+                    Database().execute("""
+                        INSERT INTO internship_applications (user_id, program_id, status)
+                        VALUES (%s, %s, 'interested')
+                        ON CONFLICT (user_id, program_id)
+                        DO UPDATE SET status = 'interested', updated_at = CURRENT_TIMESTAMP
+                    """, (st.session_state.user.id, program.id))
+                    _fetch_programs.clear()
+                    _fetch_applications.clear()
+                    # Fragment reruns reuse this object, so keep it in step with the database
+                    program.app_status = 'interested'
+                    st.toast("Marked as interested!")
+                except Exception as e:
+                    st.error(f"Failed to update status: {str(e)}")
 
-        # Define available options
-        program_types = [
-            "Summer Research", "Leadership Development",
-            "Research & Development", "Internship", "Workshop", "Fellowship"
-        ]
+        if program.app_status:
+            with status_slot:
+                st.info(f"Status: {program.app_status.title()}")
+                if program.app_date_str:
+                    st.write(f"Applied: {program.app_date_str}")
 
-        subject_areas = [
-            "Mathematics", "Science", "Engineering", "Computer Science",
-            "Leadership", "Community Service", "Business", "Arts"
-        ]
+        st.markdown(f"[Visit Website]({program.website_url})")
 
-        location_types = ["Remote", "In-person", "Hybrid"]
+def render_program_browser(interests: FrozenSet[str]):
+    """Render the program browser with filters."""
+    try:
+        st.subheader("Available Programs")
 
-        # Filter matching interests
-        matching_interests = [interest for interest in interests if interest in subject_areas]
+        # Filter matching interests with a set intersection, sorted for a stable default order
+        matching_interests = sorted(interests & _SUBJECT_AREA_SET)
 
         # Filters
         col1, col2, col3 = st.columns(3)
@@ -144,14 +285,14 @@ def render_program_browser(interests: List[str]):
         with col1:
             selected_types = st.multiselect(
                 "Program Type",
-                program_types,
+                _PROGRAM_TYPES,
                 placeholder="All Types"
             )
 
         with col2:
             selected_subjects = st.multiselect(
                 "Subject Areas",
-                subject_areas,
+                _SUBJECT_AREAS,
                 default=matching_interests if matching_interests else None,
                 placeholder="All Subjects"
             )
@@ -159,206 +300,139 @@ def render_program_browser(interests: List[str]):
         with col3:
             selected_locations = st.multiselect(
                 "Location Type",
-                location_types,
+                _LOCATION_TYPES,
                 placeholder="All Locations"
             )
 
-        # Fetch programs with filters
-        db = Database()
-        query_params = {}
-        conditions = []
-
-        # Build dynamic query conditions
-        if selected_types:
-            conditions.append("program_type = ANY(%(types)s)")
-            query_params['types'] = selected_types
-
-        if selected_subjects:
-            conditions.append("""
-                EXISTS (
-                    SELECT 1 FROM unnest(subject_areas) subject
-                    WHERE subject = ANY(%(subjects)s)
-                )
-            """)
-            query_params['subjects'] = selected_subjects
-
-        if selected_locations:
-            conditions.append("location_type = ANY(%(locations)s)")
-            query_params['locations'] = selected_locations
-
-        # Construct final query
-        query = """
-            SELECT * FROM internship_programs
-            {}
-            ORDER BY application_deadline;
-        """.format(" WHERE " + " AND ".join(conditions) if conditions else "")
-
-        programs = db.execute(query, query_params)
-
+        # Fetch programs with filters; sorted tuples make equivalent selections share a cache entry
+        programs = _fetch_programs(
+            tuple(sorted(selected_types)),
+            tuple(sorted(selected_subjects)),
+            tuple(sorted(selected_locations)),
+            st.session_state.user.id
+        )
         # Display programs
         for program in programs:
-            st.markdown(f"### 📋 {program['name']}")
-            st.markdown(f"**Deadline:** {program['application_deadline'].strftime('%B %d, %Y')}")
-
-            col1, col2 = st.columns([2, 1])
-
-            with col1:
-                st.markdown(f"**Organization:** {program['organization']}")
-                st.markdown(f"**Description:** {program['description']}")
-                st.markdown(f"**Duration:** {program['program_duration']}")
-                st.markdown(f"**Location Type:** {program['location_type']}")
-
-                # No need for json.loads since locations is already an array
-                locations = program['locations']
-                if locations:
-                    st.markdown("**Locations:** " + ", ".join(locations))
-
-                requirements = json.loads(program['requirements'])
-                st.markdown("---")
-                st.markdown("**📝 Requirements:**")
-                for key, value in requirements.items():
-                    if isinstance(value, list):
-                        st.markdown(f"**{key.title()}:**")
-                        for item in value:
-                            st.markdown(f"- {item}")
-                    else:
-                        st.markdown(f"**{key.title()}:** {value}")
-
-            with col2:
-                # Application status and actions
-                status = db.execute_one("""
-                    SELECT status, application_date
-                    FROM internship_applications
-                    WHERE user_id = %s AND program_id = %s
-                """, (st.session_state.user.id, program['id']))
-
-                if status:
-                    st.info(f"Status: {status['status'].title()}")
-                    if status['application_date']:
-                        st.write(f"Applied: {status['application_date'].strftime('%B %d, %Y')}")
-
-                # Action buttons with unique keys
-                button_key = f"program_interested_{program['id']}"
-                if st.button("Mark Interested", key=button_key):
-                    try:
-                        db.execute("""
-                            INSERT INTO internship_applications (user_id, program_id, status)
-                            VALUES (%s, %s, 'interested')
-                            ON CONFLICT (user_id, program_id)
-                            DO UPDATE SET status = 'interested', updated_at = CURRENT_TIMESTAMP
-                        """, (st.session_state.user.id, program['id']))
-                        st.success("Marked as interested!")
-                        st.rerun()
-                    except Exception as e:
-                        st.error(f"Failed to update status: {str(e)}")
-
-                st.markdown(f"[Visit Website]({program['website_url']})")
+            _program_card(program)
 
     except Exception as e:
         error_trace = traceback.format_exc()
         logger.error(f"Error rendering program browser: {str(e)}\n{error_trace}")
         show_error_message("Unable to display internship programs.", error_trace)
 
+# Application statuses in display order, with the emoji shown in each group header
+_STATUS_ORDER = ('interested', 'in_progress', 'submitted', 'accepted', 'rejected')
+_STATUS_EMOJI = {
+    'interested': '🤔',
+    'in_progress': '📝',
+    'submitted': '✉️',
+    'accepted': '🎉',
+    'rejected': '😔'
+}
+
+APPLICATION_COLUMNS = [
+    'id', 'name', 'organization', 'application_deadline', 'application_date',
+    'status', 'notes', 'website_url'
+]
+APPLICATION_READONLY_COLUMNS = [
+    'name', 'organization', 'application_deadline', 'application_date', 'website_url'
+]
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _fetch_applications(user_id: int) -> List[Dict]:
+    """Fetch a user's applications, cached until the next write clears it.
+
+    Rows come back ordered by status (in _STATUS_ORDER) and then by deadline, so they
+    can be grouped by walking the list once.
+    """
+    db = Database()
+    rows = db.execute("""
+        SELECT 
+            ia.id, ia.status, ia.application_date, ia.notes,
+            ip.name, ip.organization, ip.application_deadline,
+            ip.website_url
+        FROM internship_applications ia
+        JOIN internship_programs ip ON ia.program_id = ip.id
+        WHERE ia.user_id = %s
+        ORDER BY array_position(%s, ia.status::text), ip.application_deadline
+    """, (user_id, list(_STATUS_ORDER)))
+    return [dict(row) for row in rows]
+
+@st.fragment
 def render_applications():
-    """Render the student's internship applications."""
+    """Render the student's internship applications; edits and saves rerun only this section."""
     try:
         st.subheader("My Applications")
 
-        db = Database()
-        applications = db.execute("""
-            SELECT 
-                ia.id, ia.status, ia.application_date, ia.notes,
-                ip.name, ip.organization, ip.application_deadline,
-                ip.website_url
-            FROM internship_applications ia
-            JOIN internship_programs ip ON ia.program_id = ip.id
-            WHERE ia.user_id = %s
-            ORDER BY ip.application_deadline
-        """, (st.session_state.user.id,))
+        applications = _fetch_applications(st.session_state.user.id)
 
         if not applications:
             st.info("You haven't marked any programs yet. Browse available programs and mark the ones you're interested in!")
             return
 
-        # Group applications by status
-        status_order = ['interested', 'in_progress', 'submitted', 'accepted', 'rejected']
-        status_colors = {
-            'interested': '🤔',
-            'in_progress': '📝',
-            'submitted': '✉️',
-            'accepted': '🎉',
-            'rejected': '😔'
-        }
-
-        for status in status_order:
-            status_apps = [app for app in applications if app['status'] == status]
-            if status_apps:
-                st.markdown(f"### {status_colors[status]} {status.title()}")
-
-                for app in status_apps:
-                    with st.container():
-                        st.markdown(f"**{app['name']} - {app['organization']}**")
-
-                        col1, col2 = st.columns([3, 1])
-
-                        with col1:
-                            st.markdown(f"**Deadline:** {app['application_deadline'].strftime('%B %d, %Y')}")
-                            if app['application_date']:
-                                st.markdown(f"**Applied:** {app['application_date'].strftime('%B %d, %Y')}")
-
-                            # Notes editor with unique key
-                            notes_key = f"app_notes_{app['id']}_{status}"
-                            new_notes = st.text_area(
-                                "Application Notes",
-                                value=app['notes'] or '',
-                                key=notes_key
-                            )
-
-                            if new_notes != app['notes']:
-                                update_key = f"update_notes_{app['id']}_{status}"
-                                if st.button("Update Notes", key=update_key):
-                                    try:
-                                        db.execute("""
-                                            UPDATE internship_applications
-                                            SET notes = %s, updated_at = CURRENT_TIMESTAMP
-                                            WHERE id = %s AND user_id = %s
-                                        """, (new_notes, app['id'], st.session_state.user.id))
-                                        st.success("Notes updated!")
-                                        st.rerun()
-                                    except Exception as e:
-                                        st.error(f"Failed to update notes: {str(e)}")
-
-                        with col2:
-                            # Status updater with unique key
-                            status_key = f"app_status_{app['id']}_{status}"
-                            new_status = st.selectbox(
-                                "Update Status",
-                                status_order,
-                                index=status_order.index(app['status']),
-                                key=status_key
-                            )
-
-                            if new_status != app['status']:
-                                try:
-                                    application_date = None
-                                    if new_status == 'submitted':
-                                        application_date = datetime.now().date()
-
-                                    db.execute("""
-                                        UPDATE internship_applications
-                                        SET status = %s,
-                                            application_date = COALESCE(%s, application_date),
-                                            updated_at = CURRENT_TIMESTAMP
-                                        WHERE id = %s AND user_id = %s
-                                    """, (new_status, application_date, app['id'], st.session_state.user.id))
-                                    st.success("Status updated!")
-                                    st.rerun()
-                                except Exception as e:
-                                    st.error(f"Failed to update status: {str(e)}")
-
-                            st.markdown(f"[Visit Website]({app['website_url']})")
-
-                        st.markdown("---")
+        # One editable table per status inside a single form: edits cause no reruns and
+        # are collected and saved in one batch when the form is submitted
+        changes = []
+        with st.form("applications_form", border=False):
+            # Rows arrive sorted by status, so each group is one consecutive run
+            for status, status_apps in itertools.groupby(applications, key=lambda app: app['status']):
+                if status in _STATUS_EMOJI:
+                    st.markdown(f"### {_STATUS_EMOJI[status]} {status.title()}")
+
+                    original = pd.DataFrame(list(status_apps), columns=APPLICATION_COLUMNS).set_index('id')
+                    original['notes'] = original['notes'].fillna('')
+                    edited = st.data_editor(
+                        original,
+                        key=f"apps_editor_{status}",
+                        hide_index=True,
+                        use_container_width=True,
+                        disabled=APPLICATION_READONLY_COLUMNS,
+                        column_config={
+                            'name': "Program",
+                            'organization': "Organization",
+                            'application_deadline': st.column_config.DateColumn("Deadline", format="MMMM D, YYYY"),
+                            'application_date': st.column_config.DateColumn("Applied", format="MMMM D, YYYY"),
+                            'status': st.column_config.SelectboxColumn("Status", options=_STATUS_ORDER, required=True),
+                            'notes': st.column_config.TextColumn("Application Notes"),
+                            'website_url': st.column_config.LinkColumn("Website", display_text="Visit Website")
+                        }
+                    )
+
+                    changed = (edited['status'] != original['status']) | (edited['notes'] != original['notes'])
+                    changes.extend(
+                        (int(app_id), row['status'], row['notes'], st.session_state.user.id)
+                        for app_id, row in edited[changed].iterrows()
+                    )
+
+            submitted = st.form_submit_button("Save Changes")
+
+        if submitted and not changes:
+            st.info("No changes to save.")
+        elif submitted:
+            try:
+                # Moving an application to submitted stamps today's date, as before
+                Database().execute_many("""
+                    UPDATE internship_applications ia
+                    SET status = v.status,
+                        notes = v.notes,
+                        application_date = CASE
+                            WHEN v.status = 'submitted' AND ia.status IS DISTINCT FROM 'submitted'
+                            THEN CURRENT_DATE
+                            ELSE ia.application_date
+                        END,
+                        updated_at = CURRENT_TIMESTAMP
+                    FROM (VALUES %s) AS v(id, status, notes, user_id)
+                    WHERE ia.id = v.id AND ia.user_id = v.user_id
+                """, changes)
+                _fetch_applications.clear()
+                _fetch_programs.clear()
+                # The tables already show the saved values; drop the edit state so the
+                # next run starts from the refreshed rows
+                for status in _STATUS_ORDER:
+                    st.session_state.pop(f"apps_editor_{status}", None)
+                st.toast(f"Updated {len(changes)} application(s)!")
+            except Exception as e:
+                st.error(f"Failed to update applications: {str(e)}")
 
     except Exception as e:
         error_trace = traceback.format_exc()
@@ -367,7 +441,7 @@ def render_applications():
 
 def render_internships():
     """Render the internship programs tracker interface."""
-    if not hasattr(st.session_state, 'user'):
+    if 'user' not in st.session_state:
         st.warning("Please log in to access the internship tracker.")
         return
 
@@ -1,21 +1,37 @@
 import streamlit as st
 from models.user import User
 from utils.error_handling import handle_error, DatabaseError, ValidationError
+from components.internships import clear_student_interests_cache
 import logging
 
 logger = logging.getLogger(__name__) # Assuming logger is configured elsewhere
 
+@st.cache_data(ttl=60, show_spinner=False)
+def _get_profile_defaults(user_id):
+    """Load a user's profile once and turn it into the form's default values.
+
+    Cached per user and cleared on save; database errors propagate and are not cached.
+    """
+    profile = User(id=user_id).get_profile() or {}
+    return {
+        'gpa': float(profile['gpa']) if profile.get('gpa') else 0.0,
+        'interests': profile.get('interests') or [],
+        'activities': '\n'.join(profile.get('activities') or []),
+        'target_majors': profile.get('target_majors') or [],
+        'target_schools': '\n'.join(profile.get('target_schools') or [])
+    }
+
 @handle_error
 def render_profile():
     """Render the user profile form with error handling"""
     st.subheader("My Profile")
 
-    if not hasattr(st.session_state, 'user'):
+    if 'user' not in st.session_state:
         raise ValidationError("Please log in to access your profile")
 
     user = st.session_state.user
     try:
-        profile = user.get_profile()
+        defaults = _get_profile_defaults(user.id)
         logger.info(f"Retrieved profile for user {user.id}")
     except DatabaseError as e:
         logger.error(f"Failed to retrieve profile for user {user.id}: {str(e)}")
@@ -27,7 +43,7 @@ def render_profile():
             gpa = st.number_input("GPA", 
                                 min_value=0.0, 
                                 max_value=4.0, 
-                                value=float(profile['gpa']) if profile and profile['gpa'] else 0.0)
+                                value=defaults['gpa'])
 
             interests = st.multiselect(
                 "Academic Interests",
@@ -36,12 +52,12 @@ def render_profile():
                     "Humanities", "Social Sciences", "Natural Sciences", 
                     "Medicine", "Law"
                 ],
-                default=profile['interests'] if profile and profile['interests'] else []
+                default=defaults['interests']
             )
 
             activities = st.text_area(
                 "Extracurricular Activities",
-                value='\n'.join(profile['activities']) if profile and profile['activities'] else "",
+                value=defaults['activities'],
                 help="Enter each activity on a new line"
             )
 
@@ -52,12 +68,12 @@ def render_profile():
                     "Psychology", "Biology", "Economics", "English", "History",
                     "Mathematics", "Physics", "Chemistry", "Political Science"
                 ],
-                default=profile['target_majors'] if profile and profile['target_majors'] else []
+                default=defaults['target_majors']
             )
 
             target_schools = st.text_area(
                 "Target Schools",
-                value='\n'.join(profile['target_schools']) if profile and profile['target_schools'] else "",
+                value=defaults['target_schools'],
                 help="Enter each school on a new line"
             )
 
@@ -70,6 +86,8 @@ def render_profile():
                         target_majors=target_majors,
                         target_schools=target_schools.split('\n') if target_schools else []
                     )
+                    _get_profile_defaults.clear()
+                    clear_student_interests_cache()
                     st.success("✅ Profile updated successfully!")
                     logger.info(f"Profile updated for user {user.id}")
                 except DatabaseError as e:
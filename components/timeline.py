@@ -1,13 +1,11 @@
 import streamlit as st
 from datetime import datetime, timedelta
-import plotly.figure_factory as ff
 import pandas as pd
 from models.database import Database
 from utils.error_handling import handle_error, DatabaseError
 import logging
 import json
 import traceback
-import time
 from utils.calendar_export import generate_ics_file
 import base64
 
@@ -20,6 +18,67 @@ def show_error_message(error_message, error_trace=None):
         with st.expander("Show Error Details"):
             st.code(error_trace)
 
+@st.cache_data(ttl=60, show_spinner=False)
+def _fetch_timeline_items(user_id, deadlines_watermark, milestones_watermark):
+    """Fetch deadlines and milestones tagged by kind and chart colour, memoized until either table's watermark moves.
+
+    ``upcoming`` marks the five earliest pending items, ranked by a window function so
+    the full list comes back in the same round trip.
+    """
+    return [dict(item) for item in Database().prepared_execute("timeline_items_sel", """
+        SELECT items.*,
+               status = 'pending'
+                   AND ROW_NUMBER() OVER (PARTITION BY status = 'pending' ORDER BY due) <= 5 AS upcoming
+        FROM (
+            SELECT 'deadline' AS kind, college_name AS title, deadline_type AS subtype,
+                   deadline_date AS due, status, requirements,
+                   CASE WHEN status = 'pending' THEN 'rgb(255, 100, 100)' ELSE 'rgb(100, 255, 100)' END AS color
+            FROM application_deadlines
+            WHERE user_id = $1
+            UNION ALL
+            SELECT 'milestone', title, category, due_date, status, NULL,
+                   CASE WHEN status = 'pending' THEN 'rgb(100, 100, 255)' ELSE 'rgb(100, 255, 100)' END
+            FROM timeline_milestones
+            WHERE user_id = $1
+        ) AS items
+        ORDER BY due
+    """, (user_id,))]
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _fetch_deadlines(user_id, watermark):
+    """Fetch a user's application deadlines, memoized until their watermark moves.
+
+    Notes are extracted from the requirements JSONB by Postgres.
+    """
+    return [dict(deadline) for deadline in Database().prepared_execute("deadlines_manage_sel", """
+        SELECT id, college_name, deadline_type, deadline_date, status, requirements->>'notes' AS notes
+        FROM application_deadlines
+        WHERE user_id = $1
+        ORDER BY deadline_date
+    """, (user_id,))]
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _fetch_milestones(user_id, watermark):
+    """Fetch a user's milestones, memoized until their watermark moves."""
+    return [dict(milestone) for milestone in Database().prepared_execute("milestones_manage_sel", """
+        SELECT id, title, description, category, priority, due_date, status
+        FROM timeline_milestones
+        WHERE user_id = $1
+        ORDER BY due_date
+    """, (user_id,))]
+
+def _timeline_watermark(user_id):
+    """Return the latest updated_at of a user's deadlines and milestones.
+
+    Every insert and update sets updated_at, so a write from any session moves the
+    watermark and the cached fetches keyed on it are re-run.
+    """
+    return Database().prepared_execute("timeline_watermark_sel", """
+        SELECT
+            (SELECT MAX(updated_at) FROM application_deadlines WHERE user_id = $1) AS deadlines,
+            (SELECT MAX(updated_at) FROM timeline_milestones WHERE user_id = $1) AS milestones
+    """, (user_id,))[0]
+
 def add_calendar_export_section(deadlines):
     """Add calendar export buttons for deadlines."""
     st.subheader("📅 Export Deadlines to Calendar")
@@ -78,115 +137,115 @@ def add_calendar_export_section(deadlines):
 @handle_error
 def render_timeline():
     """Render the application timeline and deadline tracker."""
-    if not hasattr(st.session_state, 'user'):
+    if 'user' not in st.session_state:
         st.warning("Please log in to view your application timeline.")
         return
 
     st.title("📅 Application Timeline")
 
+    # One cheap query per run decides whether the cached lists are still current
+    watermark = _timeline_watermark(st.session_state.user.id)
+
     # Create tabs for different timeline views
     tab1, tab2 = st.tabs(["Timeline View", "Manage Deadlines"])
 
     with tab1:
-        render_timeline_view()
+        render_timeline_view(watermark)
 
     with tab2:
-        manage_deadlines()
+        manage_deadlines(watermark)
 
-def render_timeline_view():
+def render_timeline_view(watermark):
     """Render the visual timeline of applications and milestones."""
-    try:
-        db = Database()
-
-        # Fetch deadlines and milestones
-        deadlines = db.execute("""
-            SELECT id, college_name, deadline_type, deadline_date, status, requirements
-            FROM application_deadlines
-            WHERE user_id = %s
-            ORDER BY deadline_date
-        """, (st.session_state.user.id,))
+    # Plotly is only needed here, so pages that never show the timeline skip importing it
+    import plotly.graph_objects as go
 
-        milestones = db.execute("""
-            SELECT title, description, due_date, category, status
-            FROM timeline_milestones
-            WHERE user_id = %s
-            ORDER BY due_date
-        """, (st.session_state.user.id,))
+    try:
+        # Deadlines and milestones come back in one round trip, and are only
+        # re-queried after one of them changes
+        items = _fetch_timeline_items(st.session_state.user.id, watermark['deadlines'], watermark['milestones'])
 
-        if not deadlines and not milestones:
+        if not items:
             st.info("No deadlines or milestones added yet. Start by adding some in the 'Manage Deadlines' tab!")
             return
 
-        # Prepare data for timeline visualization
-        timeline_data = []
-        colors = []
-
-        for deadline in deadlines:
-            timeline_data.append(dict(
-                Task=f"📌 {deadline['college_name']} ({deadline['deadline_type']})",
-                Start=deadline['deadline_date'],
-                Finish=deadline['deadline_date'],
-                Status=deadline['status']
-            ))
-            colors.append('rgb(255, 100, 100)' if deadline['status'] == 'pending' else 'rgb(100, 255, 100)')
-
-        for milestone in milestones:
-            timeline_data.append(dict(
-                Task=f"🎯 {milestone['title']}",
-                Start=milestone['due_date'],
-                Finish=milestone['due_date'],
-                Status=milestone['status']
-            ))
-            colors.append('rgb(100, 100, 255)' if milestone['status'] == 'pending' else 'rgb(100, 255, 100)')
-
-        if timeline_data:
-            df = pd.DataFrame(timeline_data)
-
-            # Create Gantt chart
-            fig = ff.create_gantt(
-                df,
-                colors=colors,
-                index_col='Status',
-                show_colorbar=True,
-                group_tasks=True,
-                showgrid_x=True,
-                showgrid_y=True
+        # Prepare column arrays for the timeline in a single pass
+        count = len(items)
+        tasks = [None] * count
+        dues = [None] * count
+        statuses = [None] * count
+        colors = [None] * count
+        deadlines = []
+        upcoming = []
+
+        for i, item in enumerate(items):
+            if item['kind'] == 'deadline':
+                task = f"📌 {item['title']} ({item['subtype']})"
+                deadlines.append(dict(
+                    college_name=item['title'],
+                    deadline_type=item['subtype'],
+                    deadline_date=item['due'],
+                    requirements=item['requirements']
+                ))
+            else:
+                task = f"🎯 {item['title']}"
+
+            tasks[i] = task
+            dues[i] = item['due']
+            statuses[i] = item['status']
+            colors[i] = item['color']
+            if item['upcoming']:
+                upcoming.append((task, item['due']))
+
+        # Deadlines and milestones are instants, not intervals, so plot them as
+        # WebGL markers instead of Gantt bars
+        fig = go.Figure(go.Scattergl(
+            x=dues,
+            y=tasks,
+            mode='markers',
+            marker=dict(color=colors, size=12),
+            customdata=statuses,
+            hovertemplate="%{y}<br>%{x|%B %d, %Y}<br>Status: %{customdata}<extra></extra>"
+        ))
+
+        # Update layout
+        fig.update_layout(
+            title='Application Timeline',
+            xaxis_title='Date',
+            height=400,
+            hovermode='closest',
+            xaxis=dict(showgrid=True),
+            yaxis=dict(showgrid=True)
+        )
+
+        st.plotly_chart(fig, use_container_width=True)
+
+        # Add calendar export section
+        add_calendar_export_section(deadlines)
+
+        # Show upcoming deadlines; rows arrive ordered by due date, so these are already sorted
+        st.subheader("📅 Upcoming Deadlines")
+        today = datetime.now().date()
+        parts = []
+        for task, due in upcoming:
+            days_left = (due - today).days
+            status_color = "🔴" if days_left <= 7 else "🟡" if days_left <= 14 else "🟢"
+
+            parts.append(
+                f"{status_color} **{task}**  \n"
+                f"Due: {due.strftime('%B %d, %Y')} ({days_left} days left)"
             )
 
-            # Update layout
-            fig.update_layout(
-                title='Application Timeline',
-                xaxis_title='Date',
-                height=400
-            )
-
-            st.plotly_chart(fig, use_container_width=True)
-
-            # Add calendar export section
-            add_calendar_export_section(deadlines)
-
-            # Show upcoming deadlines
-            st.subheader("📅 Upcoming Deadlines")
-            upcoming = sorted(
-                [d for d in timeline_data if d['Status'] == 'pending'],
-                key=lambda x: x['Start']
-            )[:5]
-
-            for item in upcoming:
-                days_left = (item['Start'] - datetime.now().date()).days
-                status_color = "🔴" if days_left <= 7 else "🟡" if days_left <= 14 else "🟢"
-
-                st.markdown(f"""
-                    {status_color} **{item['Task']}**  
-                    Due: {item['Start'].strftime('%B %d, %Y')} ({days_left} days left)
-                """)
+        # All items go out as a single markdown element
+        if parts:
+            st.markdown("\n\n".join(parts))
 
     except Exception as e:
         error_trace = traceback.format_exc()
         logger.error(f"Error rendering timeline view: {str(e)}\n{error_trace}")
         show_error_message("Unable to display timeline.", error_trace)
 
-def manage_deadlines():
+def manage_deadlines(watermark):
     """Interface for managing application deadlines and milestones."""
     try:
         col1, col2 = st.columns(2)
@@ -204,40 +263,28 @@ def manage_deadlines():
 
                 if st.form_submit_button("Add Deadline"):
                     try:
-                        db = Database()
-                        db.execute("""
-                            INSERT INTO application_deadlines 
-                            (user_id, college_name, deadline_type, deadline_date, requirements)
-                            VALUES (%s, %s, %s, %s, %s)
-                        """, (
-                            st.session_state.user.id,
-                            college_name,
-                            deadline_type,
-                            deadline_date,
-                            json.dumps({"notes": requirements})
-                        ))
-                        st.success("Deadline added successfully!")
-
-                        # Add automatic reminder
-                        reminder_date = deadline_date - timedelta(days=7)
-                        db.execute("""
+                        # The deadline and its one-week reminder are inserted by one
+                        # statement, so they commit together in a single round trip
+                        Database().execute("""
+                            WITH new_deadline AS (
+                                INSERT INTO application_deadlines 
+                                (user_id, college_name, deadline_type, deadline_date, requirements)
+                                VALUES (%(user_id)s, %(college_name)s, %(deadline_type)s, %(deadline_date)s, %(requirements)s)
+                                RETURNING id
+                            )
                             INSERT INTO deadline_reminders 
                             (user_id, deadline_id, reminder_date, reminder_type)
-                            VALUES (
-                                %s,
-                                (SELECT id FROM application_deadlines WHERE user_id = %s 
-                                 AND college_name = %s AND deadline_type = %s),
-                                %s,
-                                'one_week'
-                            )
-                        """, (
-                            st.session_state.user.id,
-                            st.session_state.user.id,
-                            college_name,
-                            deadline_type,
-                            reminder_date
-                        ))
-                        time.sleep(0.5)  # Brief pause to ensure database updates are complete
+                            SELECT %(user_id)s, id, %(reminder_date)s, 'one_week'
+                            FROM new_deadline
+                        """, {
+                            'user_id': st.session_state.user.id,
+                            'college_name': college_name,
+                            'deadline_type': deadline_type,
+                            'deadline_date': deadline_date,
+                            'requirements': json.dumps({"notes": requirements}),
+                            'reminder_date': deadline_date - timedelta(days=7)
+                        })
+                        st.toast("Deadline added successfully!")
                         st.rerun()  # Refresh the page to show new deadline
 
                     except Exception as e:
@@ -275,8 +322,7 @@ def manage_deadlines():
                             priority.lower(),
                             due_date
                         ))
-                        st.success("Milestone added successfully!")
-                        time.sleep(0.5)  # Brief pause to ensure database updates are complete
+                        st.toast("Milestone added successfully!")
                         st.rerun()  # Refresh the page to show new milestone
                     except Exception as e:
                         error_trace = traceback.format_exc()
@@ -288,211 +334,159 @@ def manage_deadlines():
         existing_items = st.tabs(["Application Deadlines", "Milestones"])
 
         with existing_items[0]:
-            display_existing_deadlines()
+            display_existing_deadlines(watermark['deadlines'])
 
         with existing_items[1]:
-            display_existing_milestones()
+            display_existing_milestones(watermark['milestones'])
 
     except Exception as e:
         error_trace = traceback.format_exc()
         logger.error(f"Error in deadline management: {str(e)}\n{error_trace}")
         show_error_message("Something went wrong while managing deadlines.", error_trace)
 
-def display_existing_deadlines():
+# Statuses shared by deadlines and milestones
+STATUS_OPTIONS = ("pending", "in_progress", "completed")
+
+DEADLINE_COLUMNS = ['id', 'college_name', 'deadline_type', 'deadline_date', 'status', 'notes']
+DEADLINE_EDITABLE_COLUMNS = ['deadline_date', 'status', 'notes']
+MILESTONE_COLUMNS = ['id', 'title', 'description', 'category', 'priority', 'due_date', 'status']
+MILESTONE_EDITABLE_COLUMNS = ['title', 'description', 'priority', 'due_date', 'status']
+
+def _changed_rows(original, edited, columns):
+    """Return the rows of ``edited`` whose ``columns`` differ from ``original``."""
+    changed = (edited[columns] != original[columns]).any(axis=1)
+    return edited[changed]
+
+def display_existing_deadlines(watermark):
     """Display and manage existing application deadlines."""
     try:
-        db = Database()
-        deadlines = db.execute("""
-            SELECT id, college_name, deadline_type, deadline_date, status, requirements
-            FROM application_deadlines
-            WHERE user_id = %s
-            ORDER BY deadline_date
-        """, (st.session_state.user.id,))
-
-        for deadline in deadlines:
-            with st.expander(f"{deadline['college_name']} - {deadline['deadline_type']}"):
-                col1, col2, col3 = st.columns([2, 1, 1])
-
-                # Edit form
-                with col1:
-                    st.write(f"Due: {deadline['deadline_date'].strftime('%B %d, %Y')}")
-                    st.write(f"Status: {deadline['status'].title()}")
-                    requirements = deadline['requirements']
-                    if isinstance(requirements, str):
-                        try:
-                            requirements = json.loads(requirements)
-                        except json.JSONDecodeError:
-                            requirements = {"notes": requirements}
-
-                    # Allow editing notes
-                    new_notes = st.text_area(
-                        "Edit Notes",
-                        value=requirements.get('notes', ''),
-                        key=f"notes_{deadline['id']}"
-                    )
+        deadlines = _fetch_deadlines(st.session_state.user.id, watermark)
+        if not deadlines:
+            st.info("No deadlines added yet.")
+            return
 
-                    if st.button("Update Notes", key=f"update_notes_{deadline['id']}"):
-                        try:
-                            db.execute("""
-                                UPDATE application_deadlines
-                                SET requirements = %s, updated_at = CURRENT_TIMESTAMP
-                                WHERE id = %s AND user_id = %s
-                            """, (
-                                json.dumps({"notes": new_notes}),
-                                deadline['id'],
-                                st.session_state.user.id
-                            ))
-                            st.success("Notes updated!")
-                            time.sleep(0.5)
-                            st.rerun()
-                        except Exception as e:
-                            st.error(f"Failed to update notes: {str(e)}")
-
-                with col2:
-                    new_date = st.date_input(
-                        "Update Due Date",
-                        value=deadline['deadline_date'],
-                        key=f"date_{deadline['id']}"
-                    )
-                    if new_date != deadline['deadline_date']:
-                        if st.button("Update Date", key=f"update_date_{deadline['id']}"):
-                            try:
-                                db.execute("""
-                                    UPDATE application_deadlines
-                                    SET deadline_date = %s, updated_at = CURRENT_TIMESTAMP
-                                    WHERE id = %s AND user_id = %s
-                                """, (new_date, deadline['id'], st.session_state.user.id))
-                                st.success("Date updated!")
-                                time.sleep(0.5)
-                                st.rerun()
-                            except Exception as e:
-                                st.error(f"Failed to update date: {str(e)}")
-
-                with col3:
-                    new_status = st.selectbox(
-                        "Update Status",
-                        ["pending", "in_progress", "completed"],
-                        key=f"deadline_status_{deadline['id']}",
-                        index=["pending", "in_progress", "completed"].index(deadline['status'])
-                    )
-                    if new_status != deadline['status']:
-                        try:
-                            db.execute("""
-                                UPDATE application_deadlines
-                                SET status = %s, updated_at = CURRENT_TIMESTAMP
-                                WHERE id = %s AND user_id = %s
-                            """, (new_status, deadline['id'], st.session_state.user.id))
-                            st.success("Status updated!")
-                            time.sleep(0.5)
-                            st.rerun()
-                        except Exception as e:
-                            st.error(f"Failed to update status: {str(e)}")
+        original = pd.DataFrame(deadlines, columns=DEADLINE_COLUMNS).set_index('id')
+        original['notes'] = original['notes'].fillna('')
+
+        # One editable table instead of an expander and widgets per row; edits stay
+        # client-side until the form is submitted and are saved in one batch
+        with st.form("deadlines_form", border=False):
+            edited = st.data_editor(
+                original,
+                key="deadlines_editor",
+                hide_index=True,
+                use_container_width=True,
+                disabled=['college_name', 'deadline_type'],
+                column_config={
+                    'college_name': "College",
+                    'deadline_type': "Deadline Type",
+                    'deadline_date': st.column_config.DateColumn("Due Date", format="MMMM D, YYYY", required=True),
+                    'status': st.column_config.SelectboxColumn(
+                        "Status", options=STATUS_OPTIONS, required=True
+                    ),
+                    'notes': st.column_config.TextColumn("Notes")
+                }
+            )
+            submitted = st.form_submit_button("Save Deadlines")
+
+        if submitted:
+            changes = [
+                (int(deadline_id), row['deadline_date'], row['status'], row['notes'], st.session_state.user.id)
+                for deadline_id, row in _changed_rows(original, edited, DEADLINE_EDITABLE_COLUMNS).iterrows()
+            ]
+            if not changes:
+                st.info("No changes to save.")
+                return
+
+            try:
+                Database().execute_many("""
+                    UPDATE application_deadlines AS t
+                    SET deadline_date = v.deadline_date,
+                        status = v.status,
+                        requirements = t.requirements || jsonb_build_object('notes', v.notes),
+                        updated_at = CURRENT_TIMESTAMP
+                    FROM (VALUES %s) AS v(id, deadline_date, status, notes, user_id)
+                    WHERE t.id = v.id AND t.user_id = v.user_id
+                """, changes, template="(%s, %s::date, %s, %s::text, %s)")
+                st.session_state.pop("deadlines_editor", None)
+                st.toast(f"Updated {len(changes)} deadline(s)!")
+                # The timeline chart above was drawn before this write
+                st.rerun()
+            except Exception as e:
+                st.error(f"Failed to update deadlines: {str(e)}")
 
     except Exception as e:
         error_trace = traceback.format_exc()
         logger.error(f"Error displaying deadlines: {str(e)}\n{error_trace}")
         show_error_message("Unable to display deadlines.", error_trace)
 
-def display_existing_milestones():
+def display_existing_milestones(watermark):
     """Display and manage existing milestones."""
     try:
-        db = Database()
-        milestones = db.execute("""
-            SELECT id, title, description, category, priority, due_date, status
-            FROM timeline_milestones
-            WHERE user_id = %s
-            ORDER BY due_date
-        """, (st.session_state.user.id,))
-
-        for milestone in milestones:
-            with st.expander(f"{milestone['title']} ({milestone['category']})"):
-                col1, col2, col3 = st.columns([2, 1, 1])
-
-                with col1:
-                    # Edit title and description
-                    new_title = st.text_input(
-                        "Edit Title",
-                        value=milestone['title'],
-                        key=f"title_{milestone['id']}"
-                    )
-                    new_description = st.text_area(
-                        "Edit Description",
-                        value=milestone['description'] or '',
-                        key=f"desc_{milestone['id']}"
-                    )
-                    if st.button("Update Details", key=f"update_details_{milestone['id']}"):
-                        try:
-                            db.execute("""
-                                UPDATE timeline_milestones
-                                SET title = %s, description = %s, updated_at = CURRENT_TIMESTAMP
-                                WHERE id = %s AND user_id = %s
-                            """, (
-                                new_title,
-                                new_description,
-                                milestone['id'],
-                                st.session_state.user.id
-                            ))
-                            st.success("Details updated!")
-                            time.sleep(0.5)
-                            st.rerun()
-                        except Exception as e:
-                            st.error(f"Failed to update details: {str(e)}")
-
-                with col2:
-                    new_date = st.date_input(
-                        "Update Due Date",
-                        value=milestone['due_date'],
-                        key=f"milestone_date_{milestone['id']}"
-                    )
-                    new_priority = st.select_slider(
-                        "Update Priority",
-                        options=["Low", "Medium", "High"],
-                        value=milestone['priority'].title(),
-                        key=f"priority_{milestone['id']}"
-                    )
-                    if (new_date != milestone['due_date'] or 
-                        new_priority.lower() != milestone['priority']):
-                        if st.button("Update Date/Priority", key=f"update_date_priority_{milestone['id']}"):
-                            try:
-                                db.execute("""
-                                    UPDATE timeline_milestones
-                                    SET due_date = %s, priority = %s, updated_at = CURRENT_TIMESTAMP
-                                    WHERE id = %s AND user_id = %s
-                                """, (
-                                    new_date,
-                                    new_priority.lower(),
-                                    milestone['id'],
-                                    st.session_state.user.id
-                                ))
-                                st.success("Date and priority updated!")
-                                time.sleep(0.5)
-                                st.rerun()
-                            except Exception as e:
-                                st.error(f"Failed to update date/priority: {str(e)}")
-
-                with col3:
-                    new_status = st.selectbox(
-                        "Update Status",
-                        ["pending", "in_progress", "completed"],
-                        key=f"milestone_status_{milestone['id']}",
-                        index=["pending", "in_progress", "completed"].index(milestone['status'])
+        milestones = _fetch_milestones(st.session_state.user.id, watermark)
+        if not milestones:
+            st.info("No milestones added yet.")
+            return
+
+        original = pd.DataFrame(milestones, columns=MILESTONE_COLUMNS).set_index('id')
+        original['description'] = original['description'].fillna('')
+
+        with st.form("milestones_form", border=False):
+            edited = st.data_editor(
+                original,
+                key="milestones_editor",
+                hide_index=True,
+                use_container_width=True,
+                disabled=['category'],
+                column_config={
+                    'title': st.column_config.TextColumn("Title", required=True),
+                    'description': st.column_config.TextColumn("Description"),
+                    'category': "Category",
+                    'priority': st.column_config.SelectboxColumn(
+                        "Priority", options=["low", "medium", "high"], required=True
+                    ),
+                    'due_date': st.column_config.DateColumn("Due Date", format="MMMM D, YYYY", required=True),
+                    'status': st.column_config.SelectboxColumn(
+                        "Status", options=STATUS_OPTIONS, required=True
                     )
-                    if new_status != milestone['status']:
-                        try:
-                            db.execute("""
-                                UPDATE timeline_milestones
-                                SET status = %s, updated_at = CURRENT_TIMESTAMP,
-                                    completion_date = CASE 
-                                        WHEN %s = 'completed' THEN CURRENT_TIMESTAMP
-                                        ELSE NULL
-                                    END
-                                WHERE id = %s AND user_id = %s
-                            """, (new_status, new_status, milestone['id'], st.session_state.user.id))
-                            st.success("Status updated!")
-                            time.sleep(0.5)
-                            st.rerun()
-                        except Exception as e:
-                            st.error(f"Failed to update status: {str(e)}")
+                }
+            )
+            submitted = st.form_submit_button("Save Milestones")
+
+        if submitted:
+            changes = [
+                (int(milestone_id), row['title'], row['description'], row['priority'],
+                 row['due_date'], row['status'], st.session_state.user.id)
+                for milestone_id, row in _changed_rows(original, edited, MILESTONE_EDITABLE_COLUMNS).iterrows()
+            ]
+            if not changes:
+                st.info("No changes to save.")
+                return
+
+            try:
+                # Completion is stamped only when a milestone moves to completed
+                Database().execute_many("""
+                    UPDATE timeline_milestones AS t
+                    SET title = v.title,
+                        description = v.description,
+                        priority = v.priority,
+                        due_date = v.due_date,
+                        status = v.status,
+                        completion_date = CASE
+                            WHEN v.status <> 'completed' THEN NULL
+                            WHEN t.status = 'completed' THEN t.completion_date
+                            ELSE CURRENT_TIMESTAMP
+                        END,
+                        updated_at = CURRENT_TIMESTAMP
+                    FROM (VALUES %s) AS v(id, title, description, priority, due_date, status, user_id)
+                    WHERE t.id = v.id AND t.user_id = v.user_id
+                """, changes, template="(%s, %s, %s, %s, %s::date, %s, %s)")
+                st.session_state.pop("milestones_editor", None)
+                st.toast(f"Updated {len(changes)} milestone(s)!")
+                # The timeline chart above was drawn before this write
+                st.rerun()
+            except Exception as e:
+                st.error(f"Failed to update milestones: {str(e)}")
 
     except Exception as e:
         error_trace = traceback.format_exc()
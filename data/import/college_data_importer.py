@@ -146,50 +146,51 @@ class CollegeDataImporter:
                     failed_imports += 1
                     continue
 
-            # Process in batches
-            for i in range(0, len(values), self.batch_size):
-                batch = values[i:i + self.batch_size]
-                try:
-                    with self.db.conn.cursor() as cur:
-                        execute_values(
-                            cur,
-                            """
-                            INSERT INTO institutions (
-                                unitid, institution_name, street_address, city,
-                                zip_code, state_abbreviation, control_of_institution,
-                                sector_of_institution, housing_capacity, typical_housing_charge,
-                                typical_food_charge, mission_statement, undergraduate_application_fee,
-                                financial_aid_office_url, admissions_office_url,
-                                online_application_url, net_price_calculator_url
-                            ) VALUES %s
-                            ON CONFLICT (unitid) DO UPDATE SET
-                                institution_name = EXCLUDED.institution_name,
-                                street_address = EXCLUDED.street_address,
-                                city = EXCLUDED.city,
-                                zip_code = EXCLUDED.zip_code,
-                                state_abbreviation = EXCLUDED.state_abbreviation,
-                                control_of_institution = EXCLUDED.control_of_institution,
-                                sector_of_institution = EXCLUDED.sector_of_institution,
-                                housing_capacity = EXCLUDED.housing_capacity,
-                                typical_housing_charge = EXCLUDED.typical_housing_charge,
-                                typical_food_charge = EXCLUDED.typical_food_charge,
-                                mission_statement = EXCLUDED.mission_statement,
-                                undergraduate_application_fee = EXCLUDED.undergraduate_application_fee,
-                                financial_aid_office_url = EXCLUDED.financial_aid_office_url,
-                                admissions_office_url = EXCLUDED.admissions_office_url,
-                                online_application_url = EXCLUDED.online_application_url,
-                                net_price_calculator_url = EXCLUDED.net_price_calculator_url
-                            """,
-                            batch
-                        )
-                    self.db.conn.commit()
-                    successful_imports += len(batch)
-                    logger.info(f"Successfully imported batch of {len(batch)} records")
-                except Exception as e:
-                    self.db.conn.rollback()
-                    logger.error(f"Error importing batch: {str(e)}")
-                    failed_imports += len(batch)
-                    continue
+            # Process in batches on one pooled connection
+            with self.db.connection() as conn:
+                for i in range(0, len(values), self.batch_size):
+                    batch = values[i:i + self.batch_size]
+                    try:
+                        with conn.cursor() as cur:
+                            execute_values(
+                                cur,
+                                """
+                                INSERT INTO institutions (
+                                    unitid, institution_name, street_address, city,
+                                    zip_code, state_abbreviation, control_of_institution,
+                                    sector_of_institution, housing_capacity, typical_housing_charge,
+                                    typical_food_charge, mission_statement, undergraduate_application_fee,
+                                    financial_aid_office_url, admissions_office_url,
+                                    online_application_url, net_price_calculator_url
+                                ) VALUES %s
+                                ON CONFLICT (unitid) DO UPDATE SET
+                                    institution_name = EXCLUDED.institution_name,
+                                    street_address = EXCLUDED.street_address,
+                                    city = EXCLUDED.city,
+                                    zip_code = EXCLUDED.zip_code,
+                                    state_abbreviation = EXCLUDED.state_abbreviation,
+                                    control_of_institution = EXCLUDED.control_of_institution,
+                                    sector_of_institution = EXCLUDED.sector_of_institution,
+                                    housing_capacity = EXCLUDED.housing_capacity,
+                                    typical_housing_charge = EXCLUDED.typical_housing_charge,
+                                    typical_food_charge = EXCLUDED.typical_food_charge,
+                                    mission_statement = EXCLUDED.mission_statement,
+                                    undergraduate_application_fee = EXCLUDED.undergraduate_application_fee,
+                                    financial_aid_office_url = EXCLUDED.financial_aid_office_url,
+                                    admissions_office_url = EXCLUDED.admissions_office_url,
+                                    online_application_url = EXCLUDED.online_application_url,
+                                    net_price_calculator_url = EXCLUDED.net_price_calculator_url
+                                """,
+                                batch
+                            )
+                        conn.commit()
+                        successful_imports += len(batch)
+                        logger.info(f"Successfully imported batch of {len(batch)} records")
+                    except Exception as e:
+                        conn.rollback()
+                        logger.error(f"Error importing batch: {str(e)}")
+                        failed_imports += len(batch)
+                        continue
 
             logger.info(f"Import completed: {successful_imports} records imported successfully, "
                        f"{failed_imports} records failed, "
@@ -129,8 +129,10 @@ CREATE TABLE institutions (
 
 CREATE TABLE college_matches (
     id SERIAL PRIMARY KEY,
-    user_id INTEGER REFERENCES users(id),
+    user_id INTEGER REFERENCES users(id) UNIQUE,  -- One row per user, replaced on regeneration
     matches JSONB NOT NULL,              -- JSON object containing match details and scores
+    profile_hash BIGINT,                 -- Hash of the profile row the matches were generated from
+    version SMALLINT,                    -- Format version of the cached matches
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
@@ -234,17 +236,17 @@ CREATE INDEX idx_messages_session_id ON messages(session_id);
 -- College application indices
 CREATE INDEX idx_institutions_name ON institutions(institution_name);
 CREATE INDEX idx_institutions_state ON institutions(state_abbreviation);
-CREATE INDEX idx_college_matches_user_id ON college_matches(user_id);
 CREATE INDEX idx_user_favorite_institutions_user_id ON user_favorite_institutions(user_id);
 
 -- Timeline and deadline indices
-CREATE INDEX idx_application_deadlines_user_id ON application_deadlines(user_id);
-CREATE INDEX idx_timeline_milestones_user_id ON timeline_milestones(user_id);
+CREATE INDEX idx_application_deadlines_user_date ON application_deadlines(user_id, deadline_date);
+CREATE INDEX idx_timeline_milestones_user_date ON timeline_milestones(user_id, due_date);
 CREATE INDEX idx_deadline_reminders_deadline_id ON deadline_reminders(deadline_id);
 
 -- Internship system indices
 CREATE INDEX idx_internship_applications_user_id ON internship_applications(user_id);
 CREATE INDEX idx_internship_programs_deadline ON internship_programs(application_deadline);
+CREATE INDEX idx_internship_programs_subject_areas ON internship_programs USING GIN (subject_areas);
 CREATE INDEX idx_user_achievements_achievement_id ON user_achievements(achievement_id);
 
 
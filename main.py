@@ -25,7 +25,7 @@ def main():
         handle_oauth_callback()
 
     # Show login page, homepage, or dashboard based on state and path
-    if not hasattr(st.session_state, 'user'):
+    if 'user' not in st.session_state:
         render_home()  # Show homepage for non-logged in users
     elif st.session_state.user is None:
         if st.session_state.get('show_login', False):
@@ -2,25 +2,49 @@ import os
 import psycopg2
 import logging
 import time
-from psycopg2.extras import RealDictCursor
+import threading
+import weakref
+import orjson
+from contextlib import contextmanager
+from psycopg2.pool import ThreadedConnectionPool
+from psycopg2.extras import Json, RealDictCursor, execute_values, register_default_json, register_default_jsonb
 from utils.error_handling import DatabaseError, log_error
 from utils.config_manager import ConfigManager
 
 logger = logging.getLogger(__name__)
 
+# Decode json/jsonb columns (college matches, profile rows) with orjson instead of the stdlib parser
+register_default_json(loads=orjson.loads, globally=True)
+register_default_jsonb(loads=orjson.loads, globally=True)
+
+def _dumps_json(obj):
+    """Serialize a value for a Json adapter using orjson."""
+    return orjson.dumps(obj).decode()
+
 class Database:
     _instance = None
+    _instance_lock = threading.Lock()
     MAX_RETRIES = 3
     RETRY_DELAY = 1  # seconds
+    POOL_MIN_CONN = 2  # connections kept open between requests
+    POOL_MAX_CONN = 10
+    POOL_WAIT_TIMEOUT = 30  # seconds to wait for a free connection when all are borrowed
+    MATCHES_CACHE_VERSION = 1  # bump when the college matches format changes
+    MATCHES_MAX_AGE_HOURS = 24
 
     def __new__(cls):
+        # Streamlit serves sessions from several threads: build the pool exactly once,
+        # and only publish the instance after it initialized successfully
         if cls._instance is None:
-            cls._instance = super(Database, cls).__new__(cls)
-            cls._instance._initialize_connection()
+            with cls._instance_lock:
+                if cls._instance is None:
+                    instance = super(Database, cls).__new__(cls)
+                    instance._initialize_connection()
+                    cls._instance = instance
         return cls._instance
 
     def _initialize_connection(self):
-        """Initialize database connection with retry mechanism"""
+        """Initialize the database connection pool with retry mechanism"""
         retry_count = 0
         while retry_count < self.MAX_RETRIES:
             try:
@@ -30,14 +54,20 @@ class Database:
                 if not config:
                     raise DatabaseError("No database configuration available")
 
-                self.conn = psycopg2.connect(
+                # Names of the statements already PREPAREd on each pooled connection
+                self._prepared = weakref.WeakKeyDictionary()
+                # The pool raises PoolError once POOL_MAX_CONN are borrowed; callers wait on this instead
+                self._pool_slots = threading.BoundedSemaphore(self.POOL_MAX_CONN)
+                self.pool = ThreadedConnectionPool(
+                    self.POOL_MIN_CONN,
+                    self.POOL_MAX_CONN,
                     host=config['host'],
                     port=config['port'],
                     database=config['database'],
                     user=config['user'],
                     password=config['password']
                 )
-                logger.info("Database connection established successfully")
+                logger.info("Database connection pool established successfully")
                 self.create_tables()
                 break
             except psycopg2.Error as e:
@@ -47,20 +77,48 @@ class Database:
                     raise DatabaseError("Unable to connect to the database after multiple attempts")
                 time.sleep(self.RETRY_DELAY)
 
-    def _ensure_connection(self):
-        """Ensure database connection is alive and reconnect if necessary"""
+    @contextmanager
+    def connection(self):
+        """Borrow a connection from the pool for the duration of a with-block.
+
+        Waits up to POOL_WAIT_TIMEOUT seconds when every connection is borrowed.
+        On return the pool rolls back any transaction left open; connections
+        that broke while borrowed are closed and replaced on the next request.
+        """
+        if not self._pool_slots.acquire(timeout=self.POOL_WAIT_TIMEOUT):
+            raise DatabaseError("Database is busy, please try again")
+        try:
+            conn = self.pool.getconn()
+            broken = False
+            try:
+                yield conn
+            except (psycopg2.OperationalError, psycopg2.InterfaceError):
+                broken = True
+                raise
+            finally:
+                self.pool.putconn(conn, close=broken or bool(conn.closed))
+        finally:
+            self._pool_slots.release()
+
+    def _run(self, work):
+        """Call ``work(conn)`` on a pooled connection and return its result.
+
+        A connection the server has dropped (idle timeout, restart, failover) fails
+        with OperationalError or InterfaceError; it is closed instead of going back
+        to the pool, and ``work`` is retried once on a fresh connection.
+        """
         try:
-            # Test connection
-            with self.conn.cursor() as cur:
-                cur.execute("SELECT 1")
-        except (psycopg2.Error, AttributeError):
-            logger.warning("Database connection lost, attempting to reconnect")
-            self._initialize_connection()
+            with self.connection() as conn:
+                return work(conn)
+        except (psycopg2.OperationalError, psycopg2.InterfaceError) as e:
+            logger.warning(f"Database connection lost, retrying on a fresh connection: {str(e)}")
+        with self.connection() as conn:
+            return work(conn)
 
     def create_tables(self):
         """Create database tables if they don't exist"""
         try:
-            with self.conn.cursor() as cur:
+            with self.connection() as conn, conn.cursor() as cur:
                 # Create existing tables
                 cur.execute("""
                     CREATE TABLE IF NOT EXISTS achievements (
@@ -120,12 +178,29 @@ class Database:
 
                     CREATE TABLE IF NOT EXISTS college_matches (
                         id SERIAL PRIMARY KEY,
-                        user_id INTEGER REFERENCES users(id),
+                        user_id INTEGER REFERENCES users(id) UNIQUE,
                         matches JSONB NOT NULL,
+                        profile_hash BIGINT,
+                        version SMALLINT,
                         created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                         updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                     );
 
+                    ALTER TABLE college_matches
+                        ADD COLUMN IF NOT EXISTS profile_hash BIGINT,
+                        ADD COLUMN IF NOT EXISTS version SMALLINT;
+
+                    -- One matches row per user: keep the newest of any older duplicates
+                    DELETE FROM college_matches a
+                        USING college_matches b
+                        WHERE a.user_id = b.user_id
+                          AND (a.updated_at, a.id) < (b.updated_at, b.id);
+
+                    CREATE UNIQUE INDEX IF NOT EXISTS college_matches_user_id_key
+                        ON college_matches (user_id);
+
+                    DROP INDEX IF EXISTS idx_college_matches_user_updated;
+
                     -- New tables for timeline and deadline tracking
                     CREATE TABLE IF NOT EXISTS application_deadlines (
                         id SERIAL PRIMARY KEY,
@@ -164,6 +239,14 @@ class Database:
                         created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                     );
 
+                    -- Timeline queries filter by user and order by date: serve both from one index
+                    CREATE INDEX IF NOT EXISTS idx_application_deadlines_user_date
+                        ON application_deadlines (user_id, deadline_date);
+                    CREATE INDEX IF NOT EXISTS idx_timeline_milestones_user_date
+                        ON timeline_milestones (user_id, due_date);
+                    DROP INDEX IF EXISTS idx_application_deadlines_user_id;
+                    DROP INDEX IF EXISTS idx_timeline_milestones_user_id;
+
                     -- New tables for internship tracking
                     CREATE TABLE IF NOT EXISTS internship_programs (
                         id SERIAL PRIMARY KEY,
@@ -195,38 +278,136 @@ class Database:
                         updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                         UNIQUE(user_id, program_id)
                     );
+
+                    -- Programs are listed by deadline and filtered by overlapping subject areas
+                    CREATE INDEX IF NOT EXISTS idx_internship_programs_deadline
+                        ON internship_programs (application_deadline);
+                    CREATE INDEX IF NOT EXISTS idx_internship_programs_subject_areas
+                        ON internship_programs USING GIN (subject_areas);
                 """)
-                self.conn.commit()
+                conn.commit()
                 logger.info("Database tables created/verified successfully")
         except psycopg2.Error as e:
             log_error(e, "Table creation")
             raise DatabaseError("Failed to initialize database tables")
 
     def execute(self, query, params=None):
-        """Execute a query with automatic reconnection"""
-        try:
-            self._ensure_connection()
-            with self.conn.cursor(cursor_factory=RealDictCursor) as cur:
+        """Execute a query on a pooled connection"""
+        def work(conn):
+            with conn.cursor(cursor_factory=RealDictCursor) as cur:
                 cur.execute(query, params or ())
                 if query.strip().upper().startswith('SELECT'):
                     return cur.fetchall()
                 else:
-                    self.conn.commit()
+                    conn.commit()
                     return []
+
+        try:
+            return self._run(work)
         except psycopg2.Error as e:
             log_error(e, f"Query execution: {query}")
             raise DatabaseError("Database operation failed")
 
     def execute_one(self, query, params=None):
-        """Execute a query and return a single result with automatic reconnection"""
-        try:
-            self._ensure_connection()
-            with self.conn.cursor(cursor_factory=RealDictCursor) as cur:
+        """Execute a query on a pooled connection and return a single result"""
+        def work(conn):
+            with conn.cursor(cursor_factory=RealDictCursor) as cur:
                 cur.execute(query, params or ())
                 result = cur.fetchone()
                 if not query.strip().upper().startswith('SELECT'):
-                    self.conn.commit()
+                    conn.commit()
                 return result
+
+        try:
+            return self._run(work)
         except psycopg2.Error as e:
             log_error(e, f"Query execution (single): {query}")
-            raise DatabaseError("Database operation failed")
\ No newline at end of file
+            raise DatabaseError("Database operation failed")
+
+    def prepared_execute(self, name, query, params=()):
+        """Run a read-only query as a server-side prepared statement and return all rows.
+
+        ``query`` uses positional ``$1, $2, ...`` parameters. It is PREPAREd the first
+        time ``name`` runs on a pooled connection, so later calls on that connection
+        skip parsing and planning and only EXECUTE it.
+        """
+        def work(conn):
+            with conn.cursor(cursor_factory=RealDictCursor) as cur:
+                prepared = self._prepared.setdefault(conn, set())
+                if name not in prepared:
+                    cur.execute(f"PREPARE {name} AS {query}")
+                    prepared.add(name)
+                if params:
+                    cur.execute(f"EXECUTE {name} ({', '.join(['%s'] * len(params))})", params)
+                else:
+                    cur.execute(f"EXECUTE {name}")
+                return cur.fetchall()
+
+        try:
+            return self._run(work)
+        except psycopg2.Error as e:
+            log_error(e, f"Prepared query execution: {name}")
+            raise DatabaseError("Database operation failed")
+
+    def execute_many(self, query, rows, template=None):
+        """Execute a query once for a batch of rows using a single multi-row VALUES list"""
+        def work(conn):
+            with conn.cursor() as cur:
+                execute_values(cur, query, rows, template=template)
+                conn.commit()
+
+        try:
+            self._run(work)
+        except psycopg2.Error as e:
+            log_error(e, f"Batch query execution: {query}")
+            raise DatabaseError("Database operation failed")
+
+    def get_profile_and_matches(self, user_id):
+        """Fetch a user's profile and still-valid college matches in a single round trip.
+
+        Matches generated for an older version of the profile, an older cache
+        version, or more than MATCHES_MAX_AGE_HOURS ago are filtered out in SQL,
+        so ``updated_at`` is NULL whenever they need to be regenerated. Only the
+        ``colleges`` sub-tree of the JSONB document is sent back.
+        """
+        return self.execute_one("""
+            WITH p AS (
+                SELECT * FROM profiles WHERE user_id = %(user_id)s
+            ),
+            m AS (
+                SELECT matches->'colleges' AS colleges, updated_at
+                FROM college_matches
+                WHERE user_id = %(user_id)s
+                  AND profile_hash = (SELECT hashtextextended(row_to_json(p)::text, 0) FROM p)
+                  AND version = %(version)s
+                  AND updated_at > NOW() - INTERVAL '1 hour' * %(max_age)s
+            )
+            SELECT
+                (SELECT row_to_json(p) FROM p) AS profile,
+                (SELECT colleges FROM m) AS colleges,
+                (SELECT updated_at FROM m) AS updated_at
+        """, {
+            'user_id': user_id,
+            'version': self.MATCHES_CACHE_VERSION,
+            'max_age': self.MATCHES_MAX_AGE_HOURS
+        })
+
+    def save_college_matches(self, user_id, matches):
+        """Store generated college matches tagged with a hash of the profile they were built from,
+        replacing the user's previous matches"""
+        self.execute("""
+            INSERT INTO college_matches (user_id, matches, profile_hash, version)
+            SELECT %(user_id)s, %(matches)s,
+                   hashtextextended(row_to_json(p)::text, 0), %(version)s
+            FROM profiles p
+            WHERE p.user_id = %(user_id)s
+            ON CONFLICT (user_id) DO UPDATE SET
+                matches = EXCLUDED.matches,
+                profile_hash = EXCLUDED.profile_hash,
+                version = EXCLUDED.version,
+                updated_at = NOW()
+        """, {
+            'user_id': user_id,
+            'matches': Json(matches, dumps=_dumps_json),
+            'version': self.MATCHES_CACHE_VERSION
+        })
\ No newline at end of file
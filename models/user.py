@@ -47,8 +47,8 @@ class User:
             (self.id, gpa, interests, activities, target_majors, target_schools)
         )
 
-    def get_chat_sessions(self):
+    def get_chat_sessions(self, limit=20):
         return self.db.execute(
-            "SELECT * FROM chat_sessions WHERE user_id = %s ORDER BY created_at DESC",
-            (self.id,)
+            "SELECT id, title FROM chat_sessions WHERE user_id = %s ORDER BY created_at DESC LIMIT %s",
+            (self.id, limit)
         )
@@ -0,0 +1,38 @@
+"""Unit tests for admission chance scoring"""
+import unittest
+from components.college_explorer import calculate_admission_chance
+
+INSTITUTION_STATS = [
+    {"sat_75th_percentile": 1400, "avg_gpa": 3.5},
+    {"sat_75th_percentile": 1500, "avg_gpa": 3.9},
+    {"sat_75th_percentile": 1600, "avg_gpa": None},
+    {"sat_75th_percentile": None, "avg_gpa": 3.2},
+    {"sat_75th_percentile": 0, "avg_gpa": 0},
+]
+
+class TestAdmissionChance(unittest.TestCase):
+    """Test cases for admission chance scoring"""
+
+    def test_chance_per_profile(self):
+        """SAT and GPA bonuses should apply only where both values are present"""
+        cases = [
+            ({"sat_score": 1450, "gpa": 3.8}, [0.95, 0.65, 0.65, 0.7, 0.5]),
+            ({"sat_score": 1350}, [0.65, 0.65, 0.5, 0.5, 0.5]),
+            ({"gpa": 4.0}, [0.7, 0.7, 0.5, 0.7, 0.5]),
+            ({}, [0.5, 0.5, 0.5, 0.5, 0.5]),
+        ]
+
+        for profile, expected in cases:
+            actual = [calculate_admission_chance(profile, stats) for stats in INSTITUTION_STATS]
+            self.assertEqual(actual, expected, f"Chances should match for profile {profile}")
+
+    def test_chance_is_capped(self):
+        """Chances should never exceed 95%"""
+        chance = calculate_admission_chance(
+            {"sat_score": 1600, "gpa": 4.0},
+            {"sat_75th_percentile": 1200, "avg_gpa": 3.0}
+        )
+        self.assertEqual(chance, 0.95)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,40 @@
+"""Unit tests for the precompiled college matches validators"""
+import unittest
+import copy
+import fastjsonschema
+from components.college_matches import _COLLEGE_VALIDATOR, _MATCHES_VALIDATOR
+
+VALID_COLLEGE = {
+    "name": "Stanford University",
+    "match_score": 0.92,
+    "academic_fit": "Strong fit for a CS applicant",
+    "program_strengths": ["Computer Science", "Engineering"],
+    "extracurricular_matches": ["Robotics"],
+    "admission_stats": {"acceptance_rate": 0.04, "gpa_range": {"min": 3.9, "max": 4.0}},
+    "why_good_fit": "Strong research culture"
+}
+
+class TestCollegeMatchesSchema(unittest.TestCase):
+    """Test cases for _COLLEGE_VALIDATOR and _MATCHES_VALIDATOR"""
+
+    def test_accepts_well_formed_matches(self):
+        """A complete matches document should validate and be returned unchanged"""
+        matches = {"colleges": [VALID_COLLEGE]}
+        self.assertEqual(_MATCHES_VALIDATOR(matches), matches)
+
+    def test_rejects_missing_nested_field(self):
+        """A college without its GPA range should fail validation as a ValueError"""
+        college = copy.deepcopy(VALID_COLLEGE)
+        del college["admission_stats"]["gpa_range"]
+        with self.assertRaises(fastjsonschema.JsonSchemaException):
+            _COLLEGE_VALIDATOR(college)
+        with self.assertRaises(ValueError):
+            _MATCHES_VALIDATOR({"colleges": [college]})
+
+    def test_rejects_non_list_colleges(self):
+        """Colleges stored as anything other than a list should be rejected"""
+        with self.assertRaises(ValueError):
+            _MATCHES_VALIDATOR({"colleges": None})
+
+if __name__ == '__main__':
+    unittest.main()
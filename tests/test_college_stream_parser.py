@@ -0,0 +1,61 @@
+"""Unit tests for incremental parsing of streamed college matches"""
+import unittest
+import json
+from agents.counselor import CollegeStreamParser
+
+SAMPLE_MATCHES = {
+    "colleges": [
+        {
+            "name": "Stanford University",
+            "match_score": 0.92,
+            "program_strengths": ["Computer Science", "Engineering"],
+            "admission_stats": {"acceptance_rate": 0.04, "gpa_range": {"min": 3.9, "max": 4.0}},
+            "why_good_fit": "Strong research culture {with braces} in text"
+        },
+        {
+            "name": "University of Michigan",
+            "match_score": 0.85,
+            "program_strengths": ["Business"],
+            "admission_stats": {"acceptance_rate": 0.2, "gpa_range": {"min": 3.6, "max": 3.9}},
+            "why_good_fit": "Large alumni network"
+        }
+    ]
+}
+
+class TestCollegeStreamParser(unittest.TestCase):
+    """Test cases for CollegeStreamParser"""
+
+    def feed_in_chunks(self, text, size):
+        """Feed text to a new parser in fixed-size chunks and collect the emitted colleges"""
+        parser = CollegeStreamParser()
+        colleges = []
+        for i in range(0, len(text), size):
+            colleges.extend(parser.feed(text[i:i + size]))
+        return parser, colleges
+
+    def test_emits_every_college_regardless_of_chunking(self):
+        """Each college should be emitted exactly once for any chunk size"""
+        text = json.dumps(SAMPLE_MATCHES, indent=2)
+        for size in (1, 3, 7, 64, len(text)):
+            parser, colleges = self.feed_in_chunks(text, size)
+            self.assertEqual(colleges, SAMPLE_MATCHES["colleges"], f"Chunk size {size} should yield all colleges")
+            self.assertTrue(parser.done, f"Chunk size {size} should reach the end of the array")
+
+    def test_emits_college_before_document_completes(self):
+        """A college should be emitted as soon as its object closes"""
+        text = json.dumps(SAMPLE_MATCHES)
+        first_end = text.index("}, {") + 1
+        parser = CollegeStreamParser()
+
+        colleges = parser.feed(text[:first_end])
+
+        self.assertEqual(colleges, SAMPLE_MATCHES["colleges"][:1])
+        self.assertFalse(parser.done)
+
+    def test_ignores_documents_without_colleges(self):
+        """Nothing should be emitted when the response has no colleges array"""
+        _, colleges = self.feed_in_chunks(json.dumps({"error": "no matches"}), 5)
+        self.assertEqual(colleges, [])
+
+if __name__ == '__main__':
+    unittest.main()